@@ -0,0 +1,34 @@
+"""composite index on keys owner_id, name
+
+Revision ID: e63b2784f896
+Revises: 8173aba964e7
+Create Date: 2026-10-17 10:12:41.508317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e63b2784f896'
+down_revision: Union[str, None] = '8173aba964e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keys are always looked up within one owner, optionally by name, so a
+    # single (owner_id, name) index serves both and replaces the two others
+    op.create_index('idx_keys_owner_name', 'keys', ['owner_id', 'name'], unique=False)
+    op.drop_index('idx_keys_service', table_name='keys')
+    op.drop_index('idx_keys_owner_id', table_name='keys')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('idx_keys_owner_id', 'keys', ['owner_id'], unique=False)
+    op.create_index('idx_keys_service', 'keys', ['name'], unique=False)
+    op.drop_index('idx_keys_owner_name', table_name='keys')
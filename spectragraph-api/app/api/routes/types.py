@@ -1,10 +1,11 @@
 from typing import Any, Dict, Optional, Type
 from uuid import uuid4
 from fastapi import APIRouter, Depends
-from pydantic import BaseModel, TypeAdapter
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from spectragraph_core.core.postgre_db import get_db
 from spectragraph_core.core.models import CustomType, Profile
+from spectragraph_core.utils import get_json_schema
 from app.api.deps import get_current_user
 from spectragraph_types import (
     Domain,
@@ -267,8 +268,7 @@ def extract_input_schema(
     model: Type[BaseModel], label_key: str, icon: Optional[str] = None
 ) -> Dict[str, Any]:
 
-    adapter = TypeAdapter(model)
-    schema = adapter.json_schema()
+    schema = get_json_schema(model)
     # Use the main schema properties, not the $defs
     type_name = model.__name__
     details = schema
@@ -51,6 +51,10 @@ class Neo4jConnection:
             if not all([self._uri, self._user, self._password]):
                 raise ValueError("Neo4j connection credentials are required")
 
+            # Naming the database lets each session skip the home database
+            # lookup; unset, the server's default database is used
+            self._database = os.getenv("NEO4J_DATABASE") or None
+
             self._driver = GraphDatabase.driver(
                 self._uri,
                 auth=(self._user, self._password),
@@ -79,6 +83,10 @@ class Neo4jConnection:
         """
         return self._driver
 
+    def _session(self) -> Session:
+        """Open a session on the configured database."""
+        return self._driver.session(database=self._database)
+
     def query(self, query: str, parameters: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """
         Execute a single query.
@@ -90,7 +98,7 @@ class Neo4jConnection:
         Returns:
             List of result records as dictionaries
         """
-        with self._driver.session() as session:
+        with self._session() as session:
             result = session.run(query, parameters or {})
             return result.data()
 
@@ -109,7 +117,7 @@ class Neo4jConnection:
             result = tx.run(query, parameters or {})
             return result.data()
 
-        with self._driver.session() as session:
+        with self._session() as session:
             return session.execute_write(_execute)
 
     def execute_batch(self, queries: List[tuple[str, Dict[str, Any]]]) -> None:
@@ -123,7 +131,7 @@ class Neo4jConnection:
             for query, params in queries:
                 tx.run(query, params or {})
 
-        with self._driver.session() as session:
+        with self._session() as session:
             session.execute_write(_execute_batch)
 
     def close(self) -> None:
@@ -140,7 +148,7 @@ class Neo4jConnection:
             True if connection is successful, False otherwise
         """
         try:
-            with self._driver.session() as session:
+            with self._session() as session:
                 result = session.run("RETURN 1")
                 return result.single()[0] == 1
         except Exception:
@@ -1,5 +1,5 @@
 from uuid import UUID
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Tuple, Union
 from .models import Log
 from ..tasks.event import emit_event_task
 from .postgre_db import get_db
@@ -25,6 +25,38 @@ class Logger:
         finally:
             db.close()
 
+    @staticmethod
+    def _create_logs(
+        sketch_id: Union[str, UUID], entries: List[Tuple[EventLevel, Dict]]
+    ) -> List[str]:
+        """Create several log entries with a single commit, returning their ids"""
+        db = next(get_db())
+        try:
+            logs = [
+                Log(sketch_id=str(sketch_id), type=level.value, content=message)
+                for level, message in entries
+            ]
+            db.add_all(logs)
+            # Ids are generated client-side on flush, read them before the
+            # commit expires the objects
+            db.flush()
+            log_ids = [str(log.id) for log in logs]
+            db.commit()
+            return log_ids
+        finally:
+            db.close()
+
+    @staticmethod
+    def log_many(
+        sketch_id: Union[str, UUID], entries: List[Tuple[EventLevel, Dict]]
+    ) -> None:
+        """Log several (level, message) entries at once"""
+        if not entries:
+            return
+        log_ids = Logger._create_logs(sketch_id, entries)
+        for log_id, (level, message) in zip(log_ids, entries):
+            emit_event_task.apply(args=[log_id, str(sketch_id), level, message])
+
     @staticmethod
     def info(sketch_id: Union[str, UUID], message: Dict):
         """Log an info message"""
@@ -294,8 +294,7 @@ class Key(Base):
     )
 
     __table_args__ = (
-        Index("idx_keys_owner_id", "owner_id"),
-        Index("idx_keys_service", "name"),
+        Index("idx_keys_owner_name", "owner_id", "name"),
     )
 
 
@@ -7,6 +7,7 @@ from .registry import TransformRegistry
 from .types import FlowBranch, FlowStep
 from .logger import Logger
 from ..utils import to_json_serializable
+from tools.http_client import aclose_clients
 import asyncio
 import json
 import os
@@ -343,6 +344,7 @@ class FlowOrchestrator(Transform):
             results = loop.run_until_complete(self._async_scan(values))
             return results
         finally:
+            loop.run_until_complete(aclose_clients())
             loop.close()
 
     async def _async_scan(self, values: List[str]) -> Dict[str, Any]:
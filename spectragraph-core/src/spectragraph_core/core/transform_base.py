@@ -1,12 +1,15 @@
+import copy
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Tuple
 from pydantic import ValidationError, BaseModel, Field, create_model, TypeAdapter
 from pydantic.config import ConfigDict
 from .graph_db import Neo4jConnection
 from .logger import Logger
 from .vault import VaultProtocol
 from .graph_service import GraphService, create_graph_service
-from ..utils import resolve_type
+from ..utils import resolve_type, is_valid_domain, is_root_domain, is_valid_ip
 import warnings
 
 
@@ -14,6 +17,10 @@ class InvalidTransformParams(Exception):
     pass
 
 
+# (label, key) pairs whose bulk-write index exists, shared by every transform
+_created_indexes: set = set()
+
+
 def build_params_model(params_schema: list) -> BaseModel:
     """
     Build a strict Pydantic model from a params_schema.
@@ -47,6 +54,45 @@ def build_params_model(params_schema: list) -> BaseModel:
     return model
 
 
+@lru_cache(maxsize=None)
+def _type_schema(type_: Any) -> Dict[str, Any]:
+    """
+    Summarize the JSON schema of a transform's InputType or OutputType.
+
+    Building a TypeAdapter schema is slow, and the registry asks for every
+    transform's schemas on each listing, so results are cached per type.
+    The cached dict is shared: hand out copies, never the dict itself.
+    """
+    adapter = TypeAdapter(type_)
+    schema = adapter.json_schema()
+
+    # Handle different schema structures
+    if "$defs" in schema and schema["$defs"]:
+        # Follow the $ref in items to get the correct type (not just the first one)
+        items_ref = schema.get("items", {}).get("$ref")
+        if items_ref:
+            # Extract type name from $ref like "#/$defs/Website" -> "Website"
+            type_name = items_ref.split("/")[-1]
+            details = schema["$defs"][type_name]
+        else:
+            # Fallback: get the first type definition (for backward compatibility)
+            type_name, details = list(schema["$defs"].items())[0]
+
+        return {
+            "type": type_name,
+            "properties": [
+                {"name": prop, "type": resolve_type(info, schema)}
+                for prop, info in details["properties"].items()
+            ],
+        }
+    else:
+        # Handle simpler schemas
+        return {
+            "type": schema.get("title", "Any"),
+            "properties": [{"name": "value", "type": "object"}],
+        }
+
+
 class Transform(ABC):
     """
     Abstract base class for all transforms.
@@ -277,34 +323,7 @@ class Transform(ABC):
         if cls.InputType is NotImplemented:
             raise NotImplementedError(f"InputType must be defined in {cls.__name__}")
 
-        adapter = TypeAdapter(cls.InputType)
-        schema = adapter.json_schema()
-
-        # Handle different schema structures
-        if "$defs" in schema and schema["$defs"]:
-            # Follow the $ref in items to get the correct type (not just the first one)
-            items_ref = schema.get("items", {}).get("$ref")
-            if items_ref:
-                # Extract type name from $ref like "#/$defs/Website" -> "Website"
-                type_name = items_ref.split("/")[-1]
-                details = schema["$defs"][type_name]
-            else:
-                # Fallback: get the first type definition (for backward compatibility)
-                type_name, details = list(schema["$defs"].items())[0]
-
-            return {
-                "type": type_name,
-                "properties": [
-                    {"name": prop, "type": resolve_type(info, schema)}
-                    for prop, info in details["properties"].items()
-                ],
-            }
-        else:
-            # Handle simpler schemas
-            return {
-                "type": schema.get("title", "Any"),
-                "properties": [{"name": "value", "type": "object"}],
-            }
+        return copy.deepcopy(_type_schema(cls.InputType))
 
     @classmethod
     def generate_output_schema(cls) -> Dict[str, Any]:
@@ -317,34 +336,7 @@ class Transform(ABC):
         if cls.OutputType is NotImplemented:
             raise NotImplementedError(f"OutputType must be defined in {cls.__name__}")
 
-        adapter = TypeAdapter(cls.OutputType)
-        schema = adapter.json_schema()
-
-        # Handle different schema structures
-        if "$defs" in schema and schema["$defs"]:
-            # Follow the $ref in items to get the correct type (not just the first one)
-            items_ref = schema.get("items", {}).get("$ref")
-            if items_ref:
-                # Extract type name from $ref like "#/$defs/Website" -> "Website"
-                type_name = items_ref.split("/")[-1]
-                details = schema["$defs"][type_name]
-            else:
-                # Fallback: get the first type definition (for backward compatibility)
-                type_name, details = list(schema["$defs"].items())[0]
-
-            return {
-                "type": type_name,
-                "properties": [
-                    {"name": prop, "type": resolve_type(info, schema)}
-                    for prop, info in details["properties"].items()
-                ],
-            }
-        else:
-            # Handle simpler schemas
-            return {
-                "type": schema.get("title", "Any"),
-                "properties": [{"name": "value", "type": "object"}],
-            }
+        return copy.deepcopy(_type_schema(cls.OutputType))
 
     @abstractmethod
     async def scan(self, values: List[str]) -> List[Dict[str, Any]]:
@@ -373,6 +365,87 @@ class Transform(ABC):
     def preprocess(self, values: List[str]) -> List[str]:
         return values
 
+    @staticmethod
+    def _coerce_websites(data: List[Any]) -> List[Any]:
+        """
+        Convert URLs, {"url": ...} dicts and Website objects to Website objects.
+
+        Items are dispatched on their exact type; anything else is dropped.
+        """
+        from spectragraph_types.website import Website
+
+        dispatch = {
+            str: lambda item: Website(url=item),
+            dict: lambda item: Website(url=item["url"]) if "url" in item else None,
+            Website: lambda item: item,
+        }
+        websites = []
+        for item in data:
+            convert = dispatch.get(type(item))
+            website = convert(item) if convert else None
+            if website:
+                websites.append(website)
+        return websites
+
+    @staticmethod
+    def _coerce_domains(data: List[Any], with_root: bool = False) -> List[Any]:
+        """
+        Convert names, {"domain": ...} dicts and Domain objects to valid Domain objects.
+
+        With with_root, every domain is rebuilt with its root flag recomputed.
+        Invalid names and unsupported items are dropped.
+        """
+        from spectragraph_types.domain import Domain
+
+        dispatch = {
+            str: lambda item: item,
+            dict: lambda item: item.get("domain"),
+            Domain: lambda item: item.domain,
+        }
+        domains = []
+        for item in data:
+            convert = dispatch.get(type(item))
+            name = convert(item) if convert else None
+            if not name or not is_valid_domain(name):
+                continue
+            # The name is already validated, so the models skip Pydantic's
+            # validation via model_construct
+            if with_root:
+                domains.append(
+                    Domain.model_construct(domain=name, root=is_root_domain(name))
+                )
+            elif type(item) is Domain:
+                domains.append(item)
+            else:
+                domains.append(Domain.model_construct(domain=name))
+        return domains
+
+    @staticmethod
+    def _coerce_ips(data: List[Any]) -> List[Any]:
+        """
+        Convert addresses, {"address": ...} dicts and Ip objects to valid Ip objects.
+
+        Addresses are checked with inet_pton, then built without Pydantic
+        validation, which would only repeat that check. Anything else is dropped.
+        """
+        from spectragraph_types.ip import Ip
+
+        dispatch = {
+            str: lambda item: item,
+            dict: lambda item: item.get("address"),
+            Ip: lambda item: item.address,
+        }
+        ips = []
+        for item in data:
+            convert = dispatch.get(type(item))
+            address = convert(item) if convert else None
+            if not address or not is_valid_ip(address):
+                continue
+            ips.append(
+                item if type(item) is Ip else Ip.model_construct(address=address)
+            )
+        return ips
+
     def postprocess(
         self, results: List[Dict[str, Any]], input_data: List[str] = None
     ) -> List[Dict[str, Any]]:
@@ -490,6 +563,64 @@ class Transform(ABC):
             rel_type=rel_type
         )
 
+    def bulk_params(self) -> Dict[str, Any]:
+        """
+        Parameters shared by every bulk MERGE statement besides its rows.
+
+        Returns:
+            $sketch_id and $created_at (ISO 8601 UTC timestamp)
+        """
+        return {
+            "sketch_id": self.sketch_id,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+    def ensure_indexes(self, keys: Iterable[Tuple[str, str]]) -> None:
+        """
+        Create the index backing each bulk MERGE key, once per process.
+
+        Bulk MERGE queries match nodes on a key property plus sketch_id,
+        not on the fingerprint create_node merges on, so they need their
+        own (key, sketch_id) index.
+
+        Args:
+            keys: (label, key property) pairs, e.g. ("website", "url")
+        """
+        for label, key in keys:
+            if (label, key) in _created_indexes:
+                continue
+            self.neo4j_conn.query(
+                f"CREATE INDEX {label}_{key} IF NOT EXISTS "
+                f"FOR (n:{label}) ON (n.{key}, n.sketch_id)"
+            )
+            _created_indexes.add((label, key))
+
+    def bulk_merge(
+        self,
+        writes: Sequence[Tuple[str, List[Dict[str, Any]]]],
+        batch_size: int,
+        indexes: Iterable[Tuple[str, str]] = (),
+    ) -> None:
+        """
+        Write rows with UNWIND queries in a single transaction.
+
+        Args:
+            writes: (query, rows) pairs, run in order. Each query unwinds
+                $rows and may use the parameters from bulk_params()
+            batch_size: Maximum number of rows per statement
+            indexes: (label, key property) pairs passed to ensure_indexes
+        """
+        params = self.bulk_params()
+        statements = [
+            (query, {**params, "rows": rows[i : i + batch_size]})
+            for query, rows in writes
+            for i in range(0, len(rows), batch_size)
+        ]
+        if not statements:
+            return
+        self.ensure_indexes(indexes)
+        self.neo4j_conn.execute_batch(statements)
+
     def log_graph_message(self, message: str) -> None:
         """
         Log a graph operation message.
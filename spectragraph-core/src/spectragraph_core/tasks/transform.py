@@ -14,6 +14,7 @@ from sqlalchemy.orm import Session
 from ..core.logger import Logger
 from ..core.enums import EventLevel
 from spectragraph_core.utils import to_json_serializable
+from tools.http_client import aclose_clients
 
 load_dotenv()
 
@@ -26,6 +27,13 @@ db: Session = next(get_db())
 logger = Logger()
 
 
+async def _execute(transform, values: List[str]):
+    try:
+        return await transform.execute(values=values)
+    finally:
+        await aclose_clients()
+
+
 @celery.task(name="run_transform", bind=True)
 def run_transform(
     self,
@@ -69,7 +77,7 @@ def run_transform(
             vault=vault,
         )
 
-        results = asyncio.run(transform.execute(values=values))
+        results = asyncio.run(_execute(transform, values))
 
         scan.status = EventLevel.COMPLETED
         scan.results = to_json_serializable(results)
@@ -15,6 +15,20 @@ from pydantic import BaseModel, TypeAdapter
 
 
 def is_valid_ip(address: str) -> bool:
+    # inet_pton is a direct libc call, much cheaper than building an
+    # ipaddress object when only a boolean is needed. It rejects scoped IPv6
+    # addresses ("fe80::1%eth0"), so those still go through ipaddress.
+    if isinstance(address, str) and "%" not in address:
+        try:
+            socket.inet_pton(socket.AF_INET, address)
+            return True
+        except (OSError, ValueError):
+            pass
+        try:
+            socket.inet_pton(socket.AF_INET6, address)
+            return True
+        except (OSError, ValueError):
+            return False
     try:
         ipaddress.ip_address(address)
         return True
@@ -34,9 +48,18 @@ def is_valid_email(email: str) -> bool:
     return True
 
 
+# Compiled once: is_valid_domain runs for every item of every domain list
+_DOMAIN_RE = re.compile(r"^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+
 def is_valid_domain(url_or_domain: str) -> str:
 
     try:
+        # Bare hostnames are the common case and need no URL parsing. Anything
+        # else, including whitespace urlparse would strip, takes the full path.
+        if _DOMAIN_RE.fullmatch(url_or_domain):
+            return True
+
         parsed = urlparse(
             url_or_domain if "://" in url_or_domain else "http://" + url_or_domain
         )
@@ -45,7 +68,7 @@ def is_valid_domain(url_or_domain: str) -> str:
         if not hostname or "." not in hostname:
             return False
 
-        if not re.match(r"^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", hostname):
+        if not _DOMAIN_RE.match(hostname):
             return False
 
         return True
@@ -159,9 +182,20 @@ def resolve_type(details: dict, schema_context: dict = None) -> str:
     return "any"
 
 
+# JSON schemas of the type models, generated once per process and shared
+# between requests. Callers must treat the returned dicts as read-only.
+_SCHEMAS: Dict[type, Dict[str, Any]] = {}
+
+
+def get_json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    schema = _SCHEMAS.get(model)
+    if schema is None:
+        schema = _SCHEMAS[model] = TypeAdapter(model).json_schema()
+    return schema
+
+
 def extract_input_schema_flow(model: Type[BaseModel]) -> Dict[str, Any]:
-    adapter = TypeAdapter(model)
-    schema = adapter.json_schema()
+    schema = get_json_schema(model)
 
     # Use the main schema properties, not the $defs
     type_name = model.__name__
@@ -0,0 +1,41 @@
+import pytest
+from spectragraph_core.utils import is_valid_domain, is_valid_ip
+
+
+@pytest.mark.parametrize(
+    "address",
+    ["8.8.8.8", "0.0.0.0", "::1", "2001:db8::1", "::ffff:1.2.3.4", "fe80::1%eth0"],
+)
+def test_is_valid_ip_accepts(address):
+    assert is_valid_ip(address)
+
+
+@pytest.mark.parametrize(
+    "address",
+    ["", "256.1.1.1", "01.2.3.4", "1.2.3", " 1.2.3.4", "1::2::3", "1.2.3.4%eth0"],
+)
+def test_is_valid_ip_rejects(address):
+    assert not is_valid_ip(address)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "example.com",
+        "sub.example.co.uk",
+        "https://example.com/path",
+        "user@example.com",
+        # urlparse strips tabs and line breaks before the hostname is checked
+        "example.com\r\n",
+        "ex\tample.com",
+    ],
+)
+def test_is_valid_domain_accepts(value):
+    assert is_valid_domain(value)
+
+
+@pytest.mark.parametrize(
+    "value", ["", "localhost", "example", " example.com", "exa mple.com", "1.2.3.4"]
+)
+def test_is_valid_domain_rejects(value):
+    assert not is_valid_domain(value)
@@ -1,13 +1,41 @@
 import os
+import socket
+from ipaddress import IPv4Network, IPv6Network, ip_network
 from typing import Any, Dict, List, Optional, Union
 from spectragraph_core.core.transform_base import Transform
 from spectragraph_core.core.graph_db import Neo4jConnection
 from spectragraph_types.cidr import CIDR
 from spectragraph_types.ip import Ip
 from spectragraph_core.core.logger import Logger
+from spectragraph_core.utils import is_valid_ip
 from tools.network.mapcidr import MapcidrTool
 
 
+def _expand_network(network: Union[IPv4Network, IPv6Network]) -> List[str]:
+    """List every address of network, as mapcidr does with no flags."""
+    if isinstance(network, IPv4Network):
+        # Plain integer arithmetic is several times faster than iterating
+        # IPv4Address objects and formatting each one
+        first = int(network.network_address)
+        return [
+            socket.inet_ntoa(n.to_bytes(4, "big"))
+            for n in range(first, first + network.num_addresses)
+        ]
+    return [str(address) for address in network]
+
+
+def _parse_network(value: Any) -> Optional[Union[IPv4Network, IPv6Network]]:
+    """The network value denotes, or None when it is not a valid CIDR.
+
+    Same strict parsing as CIDR's IPvAnyNetwork field, without building a
+    ValidationError for every rejected value.
+    """
+    try:
+        return ip_network(value)
+    except (ValueError, TypeError):
+        return None
+
+
 class CidrToIpsTransform(Transform):
     """[MAPCIDR] Takes a CIDR and returns its corresponding IP addresses."""
 
@@ -15,6 +43,10 @@ class CidrToIpsTransform(Transform):
     InputType = List[CIDR]
     OutputType = List[Ip]
 
+    # Networks up to this many addresses are expanded in-process instead of
+    # paying for a mapcidr container run (a /16 holds 65536)
+    LOCAL_EXPAND_MAX = 65536
+
     def __init__(
         self,
         sketch_id: Optional[str] = None,
@@ -63,55 +95,66 @@ class CidrToIpsTransform(Transform):
     def preprocess(self, data: Union[List[str], List[dict], InputType]) -> InputType:
         cleaned: InputType = []
         for item in data:
-            cidr_obj = None
-            try:
-                if isinstance(item, str):
-                    cidr_obj = CIDR(network=item)
-                elif isinstance(item, dict) and "network" in item:
-                    cidr_obj = CIDR(network=item["network"])
-                elif isinstance(item, CIDR):
-                    cidr_obj = item
-                if cidr_obj:
-                    cleaned.append(cidr_obj)
-            except ValueError:
+            if isinstance(item, CIDR):
+                cleaned.append(item)
+                continue
+            if isinstance(item, str):
+                value = item
+            elif isinstance(item, dict) and "network" in item:
+                value = item["network"]
+            else:
+                continue
+            network = _parse_network(value)
+            if network is None:
                 Logger.warn(self.sketch_id, {"message": f"Invalid CIDR format: {item}"})
                 continue
+            # Already parsed, so the model is built without validating again
+            cleaned.append(CIDR.model_construct(network=network))
         return cleaned
 
     async def scan(self, data: InputType) -> OutputType:
-        """Find IP addresses from CIDR using mapcidr."""
+        """Find IP addresses from CIDR, expanding large networks with mapcidr."""
         ips: OutputType = []
-        mapcidr = MapcidrTool()
+        mapcidr = None
 
         # Retrieve API key from vault or environment (optional)
         api_key = self.get_secret("PDCP_API_KEY", os.getenv("PDCP_API_KEY"))
 
         for cidr in data:
             try:
-                # Use mapcidr tool to get IPs from CIDR, passing the API key
-                ip_addresses = mapcidr.launch(cidr.network, api_key=api_key)
-
-                if ip_addresses:
-                    for ip_str in ip_addresses:
-                        try:
-                            ip = Ip(address=ip_str.strip())
-                            ips.append(ip)
-                        except Exception as e:
-                            Logger.error(
-                                self.sketch_id,
-                                {"message": f"Failed to parse IP {ip_str}: {str(e)}"},
-                            )
-
+                if cidr.network.num_addresses <= self.LOCAL_EXPAND_MAX:
+                    source = "LOCAL"
+                    # Addresses computed from the network are valid by
+                    # construction and need no Pydantic validation
+                    found = [
+                        Ip.model_construct(address=address)
+                        for address in _expand_network(cidr.network)
+                    ]
+                else:
+                    # Stream mapcidr's output instead of splitting it whole,
+                    # passing the API key
+                    source = "MAPCIDR"
+                    mapcidr = mapcidr or MapcidrTool()
+                    found = [
+                        Ip.model_construct(address=address)
+                        for address in mapcidr.launch_iter(
+                            cidr.network, api_key=api_key
+                        )
+                        if is_valid_ip(address)
+                    ]
+
+                if found:
+                    ips.extend(found)
                     Logger.info(
                         self.sketch_id,
                         {
-                            "message": f"[MAPCIDR] Found {len(ip_addresses)} IPs for CIDR {cidr.network}"
+                            "message": f"[{source}] Found {len(found)} IPs for CIDR {cidr.network}"
                         },
                     )
                 else:
                     Logger.warn(
                         self.sketch_id,
-                        {"message": f"[MAPCIDR] No IPs found for CIDR {cidr.network}"},
+                        {"message": f"[{source}] No IPs found for CIDR {cidr.network}"},
                     )
 
             except Exception as e:
@@ -77,12 +77,13 @@ class CryptoWalletAddressToNFTs(Transform):
         cleaned: InputType = []
         for item in data:
             wallet_obj = None
-            if isinstance(item, str):
-                wallet_obj = CryptoWallet(address=item)
+            if isinstance(item, CryptoWallet):
+                wallet_obj = item
+            elif isinstance(item, str):
+                # A str address is all the model checks, so skip validation
+                wallet_obj = CryptoWallet.model_construct(address=item)
             elif isinstance(item, dict) and "address" in item:
                 wallet_obj = CryptoWallet(address=item["address"])
-            elif isinstance(item, CryptoWallet):
-                wallet_obj = item
             if wallet_obj:
                 cleaned.append(wallet_obj)
         return cleaned
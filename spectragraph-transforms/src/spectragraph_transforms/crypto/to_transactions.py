@@ -1,16 +1,27 @@
+import json
 import os
 from typing import List, Dict, Any, Optional, Union
 import requests
 import requests.exceptions
 from datetime import datetime
 from dotenv import load_dotenv
+from pydantic import TypeAdapter
 from spectragraph_core.core.transform_base import Transform
 from spectragraph_types.wallet import CryptoWallet, CryptoWalletTransaction
 from spectragraph_core.core.graph_db import Neo4jConnection
 from spectragraph_core.core.logger import Logger
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 load_dotenv()
 
+# Validates a whole txlist in one pydantic-core pass instead of one model
+# construction per row
+_TRANSACTIONS = TypeAdapter(List[CryptoWalletTransaction])
+
 
 def wei_to_eth(wei_str):
     return int(wei_str) / 10**18
@@ -83,12 +94,13 @@ class CryptoWalletAddressToTransactions(Transform):
         cleaned: InputType = []
         for item in data:
             wallet_obj = None
-            if isinstance(item, str):
-                wallet_obj = CryptoWallet(address=item)
+            if isinstance(item, CryptoWallet):
+                wallet_obj = item
+            elif isinstance(item, str):
+                # A str address is all the model checks, so skip validation
+                wallet_obj = CryptoWallet.model_construct(address=item)
             elif isinstance(item, dict) and "address" in item:
                 wallet_obj = CryptoWallet(address=item["address"])
-            elif isinstance(item, CryptoWallet):
-                wallet_obj = item
             if wallet_obj:
                 cleaned.append(wallet_obj)
         return cleaned
@@ -111,7 +123,6 @@ class CryptoWalletAddressToTransactions(Transform):
     async def _get_transactions(
         self, address: str, api_key: str, api_url: str
     ) -> List[CryptoWalletTransaction]:
-        transactions = []
         """Get transactions for a wallet address."""
         params = {
             "module": "account",
@@ -142,8 +153,9 @@ class CryptoWalletAddressToTransactions(Transform):
             raise ValueError(f"An error occurred fetching {api_url}: {str(e)}")
 
         try:
-            data = response.json()
-        except requests.exceptions.JSONDecodeError as e:
+            # txlist payloads run to thousands of rows, parse the raw bytes
+            data = _json_loads(response.content)
+        except ValueError as e:
             raise ValueError(
                 f"An error occurred fetching {api_url}: Invalid JSON response - {str(e)}"
             )
@@ -153,8 +165,8 @@ class CryptoWalletAddressToTransactions(Transform):
             error_message = data.get("message", "Unknown API error")
             raise ValueError(f"An error occurred fetching {api_url}: {error_message}")
 
-        results = data.get("result", [])
-        for tx in results:
+        rows = []
+        for tx in data.get("result", []):
             # Properly determine source and target based on transaction data
             source_address = tx["from"]
 
@@ -166,26 +178,26 @@ class CryptoWalletAddressToTransactions(Transform):
                     tx["contractAddress"] if tx["contractAddress"] else address
                 )
 
-            transactions.append(
-                CryptoWalletTransaction(
-                    source=CryptoWallet(address=source_address),
-                    target=CryptoWallet(address=target_address),
-                    hash=tx["hash"],
-                    value=wei_to_eth(tx["value"]),
-                    timestamp=tx["timeStamp"],
-                    block_number=tx["blockNumber"],
-                    block_hash=tx["blockHash"],
-                    nonce=tx["nonce"],
-                    transaction_index=tx["transactionIndex"],
-                    gas=tx["gas"],
-                    gas_price=tx["gasPrice"],
-                    gas_used=tx["gasUsed"],
-                    cumulative_gas_used=tx["cumulativeGasUsed"],
-                    input=tx["input"],
-                    contract_address=tx["contractAddress"],
-                )
+            rows.append(
+                {
+                    "source": {"address": source_address},
+                    "target": {"address": target_address},
+                    "hash": tx["hash"],
+                    "value": wei_to_eth(tx["value"]),
+                    "timestamp": tx["timeStamp"],
+                    "block_number": tx["blockNumber"],
+                    "block_hash": tx["blockHash"],
+                    "nonce": tx["nonce"],
+                    "transaction_index": tx["transactionIndex"],
+                    "gas": tx["gas"],
+                    "gas_price": tx["gasPrice"],
+                    "gas_used": tx["gasUsed"],
+                    "cumulative_gas_used": tx["cumulativeGasUsed"],
+                    "input": tx["input"],
+                    "contract_address": tx["contractAddress"],
+                }
             )
-        return transactions
+        return _TRANSACTIONS.validate_python(rows)
 
     def postprocess(self, results: OutputType, original_input: InputType) -> OutputType:
         if not self.neo4j_conn:
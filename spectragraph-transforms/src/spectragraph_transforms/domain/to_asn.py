@@ -6,7 +6,6 @@ from spectragraph_core.core.transform_base import Transform
 from spectragraph_core.core.graph_db import Neo4jConnection
 from spectragraph_types.domain import Domain
 from spectragraph_types.asn import ASN
-from spectragraph_core.utils import is_valid_domain
 from spectragraph_core.core.logger import Logger
 from tools.network.asnmap import AsnmapTool
 
@@ -64,20 +63,7 @@ class DomainToAsnTransform(Transform):
         return "domain"
 
     def preprocess(self, data: Union[List[str], List[dict], InputType]) -> InputType:
-        cleaned: InputType = []
-        for item in data:
-            domain_obj = None
-            if isinstance(item, str):
-                if is_valid_domain(item):
-                    domain_obj = Domain(domain=item)
-            elif isinstance(item, dict) and "domain" in item:
-                if is_valid_domain(item["domain"]):
-                    domain_obj = Domain(domain=item["domain"])
-            elif isinstance(item, Domain):
-                domain_obj = item
-            if domain_obj:
-                cleaned.append(domain_obj)
-        return cleaned
+        return self._coerce_domains(data)
 
     async def scan(self, data: InputType) -> OutputType:
         results: OutputType = []
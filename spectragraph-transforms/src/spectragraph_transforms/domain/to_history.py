@@ -6,7 +6,6 @@ from spectragraph_core.core.transform_base import Transform
 from spectragraph_types.domain import Domain
 from spectragraph_types.individual import Individual
 from spectragraph_types.organization import Organization
-from spectragraph_core.utils import is_valid_domain, is_root_domain
 from spectragraph_types.address import Location
 from spectragraph_core.core.logger import Logger
 from spectragraph_core.core.graph_db import Neo4jConnection
@@ -68,23 +67,7 @@ class DomainToHistoryTransform(Transform):
         return "domain"
 
     def preprocess(self, data: Union[List[str], List[dict], InputType]) -> InputType:
-        cleaned: InputType = []
-        for item in data:
-            domain_obj = None
-            if isinstance(item, str):
-                domain_obj = Domain(domain=item, root=is_root_domain(item))
-            elif isinstance(item, dict) and "domain" in item:
-                domain_obj = Domain(
-                    domain=item["domain"], root=is_root_domain(item["domain"])
-                )
-            elif isinstance(item, Domain):
-                # If the Domain object already exists, update its root field
-                domain_obj = Domain(
-                    domain=item.domain, root=is_root_domain(item.domain)
-                )
-            if domain_obj and is_valid_domain(domain_obj.domain):
-                cleaned.append(domain_obj)
-        return cleaned
+        return self._coerce_domains(data, with_root=True)
 
     async def scan(self, data: InputType) -> OutputType:
         """Find infos related to domains using whoxy api."""
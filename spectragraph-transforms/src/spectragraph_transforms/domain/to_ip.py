@@ -1,10 +1,10 @@
+import asyncio
 import socket
 from typing import List, Union
 from spectragraph_core.core.logger import Logger
 from spectragraph_core.core.transform_base import Transform
 from spectragraph_types.domain import Domain
 from spectragraph_types.ip import Ip
-from spectragraph_core.utils import is_valid_domain, is_root_domain
 
 
 class ResolveTransform(Transform):
@@ -14,6 +14,9 @@ class ResolveTransform(Transform):
     InputType = List[Domain]
     OutputType = List[Ip]
 
+    # Lookups in flight at once; each one holds a worker thread
+    CONCURRENCY = 64
+
     @classmethod
     def name(cls) -> str:
         return "domain_to_ip"
@@ -81,8 +84,8 @@ class ResolveTransform(Transform):
 
         ### 2. DNS Resolution
 
-        - Uses Python's `socket.gethostbyname()` for DNS queries
-        - Resolves each domain to its primary A record
+        - Uses Python's `socket.gethostbyname()` for DNS queries, run in worker threads
+        - Resolves domains concurrently, each to its primary A record
         - Handles resolution errors gracefully
 
         ### 3. Result Storage
@@ -185,9 +188,9 @@ class ResolveTransform(Transform):
 
         ### Resolution Speed
 
-        - Sequential DNS queries (not parallelized)
+        - DNS queries run concurrently, up to 64 at a time
         - Typical resolution time: 10-100ms per domain
-        - Consider batch size for large domain lists
+        - Results keep the order of the input domains
 
         ### DNS Caching
 
@@ -259,36 +262,28 @@ class ResolveTransform(Transform):
         """
 
     def preprocess(self, data: Union[List[str], List[dict], InputType]) -> InputType:
-        cleaned: InputType = []
-        for item in data:
-            domain_obj = None
-            if isinstance(item, str):
-                domain_obj = Domain(domain=item, root=is_root_domain(item))
-            elif isinstance(item, dict) and "domain" in item:
-                domain_obj = Domain(
-                    domain=item["domain"], root=is_root_domain(item["domain"])
-                )
-            elif isinstance(item, Domain):
-                # If the Domain object already exists, update its root field
-                domain_obj = Domain(
-                    domain=item.domain, root=is_root_domain(item.domain)
-                )
-            if domain_obj and is_valid_domain(domain_obj.domain):
-                cleaned.append(domain_obj)
-        return cleaned
+        return self._coerce_domains(data, with_root=True)
 
     async def scan(self, data: InputType) -> OutputType:
+        semaphore = asyncio.Semaphore(self.CONCURRENCY)
+
+        async def resolve(domain: str) -> str:
+            # gethostbyname blocks, so it runs off the event loop
+            async with semaphore:
+                return await asyncio.to_thread(socket.gethostbyname, domain)
+
+        addresses = await asyncio.gather(
+            *(resolve(d.domain) for d in data), return_exceptions=True
+        )
         results: OutputType = []
-        for d in data:
-            try:
-                ip = socket.gethostbyname(d.domain)
-                results.append(Ip(address=ip))
-            except Exception as e:
+        for d, address in zip(data, addresses):
+            if isinstance(address, Exception):
                 Logger.info(
                     self.sketch_id,
-                    {"message": f"Error resolving {d.domain}: {e}"},
+                    {"message": f"Error resolving {d.domain}: {address}"},
                 )
                 continue
+            results.append(Ip(address=address))
         return results
 
     def postprocess(self, results: OutputType, original_input: InputType) -> OutputType:
@@ -28,18 +28,7 @@ class SubdomainTransform(Transform):
         return "domain"
 
     def preprocess(self, data: Union[List[str], List[dict], InputType]) -> InputType:
-        cleaned: InputType = []
-        for item in data:
-            domain_obj = None
-            if isinstance(item, str):
-                domain_obj = Domain(domain=item)
-            elif isinstance(item, dict) and "domain" in item:
-                domain_obj = Domain(domain=item["domain"])
-            elif isinstance(item, Domain):
-                domain_obj = item
-            if domain_obj and is_valid_domain(domain_obj.domain):
-                cleaned.append(domain_obj)
-        return cleaned
+        return self._coerce_domains(data)
 
     async def scan(self, data: InputType) -> OutputType:
         """Find subdomains using subfinder (Docker) or fallback to crt.sh."""
@@ -71,20 +60,20 @@ class SubdomainTransform(Transform):
                 f"https://crt.sh/?q=%25.{domain}&output=json", timeout=60
             )
             if response.ok:
-                entries = response.json()
-                for entry in entries:
-                    name_value = entry.get("name_value", "")
-                    for sub in name_value.split("\n"):
-                        sub = sub.strip().lower()
-                        if (
-                            "*" not in sub
-                            and is_valid_domain(sub)
-                            and sub.endswith(domain)
-                            and sub != domain
-                        ):
-                            subdomains.add(sub)
-                        elif "*" in sub:
-                            continue
+                # crt.sh repeats the same names across many certificates, so
+                # dedupe all of them at once before validating each only once
+                blob = "\n".join(
+                    entry.get("name_value", "") for entry in response.json()
+                ).lower()
+                names = {sub.strip() for sub in blob.split("\n")}
+                subdomains = {
+                    sub
+                    for sub in names
+                    if "*" not in sub
+                    and sub != domain
+                    and sub.endswith(domain)
+                    and is_valid_domain(sub)
+                }
         except Exception as e:
             Logger.error(
                 self.sketch_id, {"message": f"crt.sh failed for {domain}: {e}"}
@@ -1,6 +1,7 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Union
 import requests
-from spectragraph_core.utils import is_valid_domain
 from spectragraph_core.core.transform_base import Transform
 from spectragraph_types.domain import Domain
 from spectragraph_types.website import Website
@@ -14,6 +15,9 @@ class DomainToWebsiteTransform(Transform):
     InputType = List[Domain]
     OutputType = List[Website]
 
+    # Domains probed at once; each probe is up to two HEAD requests
+    MAX_WORKERS = 16
+
     @classmethod
     def name(cls) -> str:
         return "domain_to_website"
@@ -27,61 +31,52 @@ class DomainToWebsiteTransform(Transform):
         return "domain"
 
     def preprocess(self, data: Union[List[str], List[dict], InputType]) -> InputType:
-        cleaned: InputType = []
-        for item in data:
-            domain_obj = None
-            if isinstance(item, str):
-                if is_valid_domain(item):
-                    domain_obj = Domain(domain=item)
-            elif isinstance(item, dict) and "domain" in item:
-                if is_valid_domain(item["domain"]):
-                    domain_obj = Domain(domain=item["domain"])
-            elif isinstance(item, Domain):
-                domain_obj = item
-            if domain_obj:
-                cleaned.append(domain_obj)
-        return cleaned
+        return self._coerce_domains(data)
 
     async def scan(self, data: InputType) -> OutputType:
-        results: OutputType = []
-        for domain in data:
-            try:
-                # Try HTTPS first
-                try:
-                    https_url = f"https://{domain.domain}"
-                    response = requests.head(
-                        https_url, timeout=10, allow_redirects=True
+        # requests is blocking: probe the domains on a bounded thread pool
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as pool:
+            return list(
+                await asyncio.gather(
+                    *(
+                        loop.run_in_executor(pool, self._probe, domain)
+                        for domain in data
                     )
-                    if response.status_code < 400:
-                        results.append(Website(url=https_url, domain=domain, active=True))
-                        continue
-                except requests.RequestException:
-                    pass
-
-                # Try HTTP if HTTPS fails
-                try:
-                    http_url = f"http://{domain.domain}"
-                    response = requests.head(http_url, timeout=10, allow_redirects=True)
-                    if response.status_code < 400:
-                        results.append(Website(url=http_url, domain=domain, active=True))
-                        continue
-                except requests.RequestException:
-                    pass
-
-                # If both fail, still add HTTPS URL as default
-                results.append(Website(url=f"https://{domain.domain}", domain=domain, active=False))
-
-            except Exception as e:
-                Logger.error(
-                    self.sketch_id,
-                    {
-                        "message": f"Error converting domain {domain.domain} to website: {e}"
-                    },
                 )
-                # Add HTTPS URL as fallback
-                results.append(Website(url=f"https://{domain.domain}", domain=domain, active=False))
+            )
 
-        return results
+    def _probe(self, domain: Domain) -> Website:
+        """Return the website of a domain, trying HTTPS then HTTP."""
+        try:
+            # Try HTTPS first
+            try:
+                https_url = f"https://{domain.domain}"
+                response = requests.head(https_url, timeout=10, allow_redirects=True)
+                if response.status_code < 400:
+                    return Website(url=https_url, domain=domain, active=True)
+            except requests.RequestException:
+                pass
+
+            # Try HTTP if HTTPS fails
+            try:
+                http_url = f"http://{domain.domain}"
+                response = requests.head(http_url, timeout=10, allow_redirects=True)
+                if response.status_code < 400:
+                    return Website(url=http_url, domain=domain, active=True)
+            except requests.RequestException:
+                pass
+
+            # If both fail, still add HTTPS URL as default
+            return Website(url=f"https://{domain.domain}", domain=domain, active=False)
+
+        except Exception as e:
+            Logger.error(
+                self.sketch_id,
+                {"message": f"Error converting domain {domain.domain} to website: {e}"},
+            )
+            # Add HTTPS URL as fallback
+            return Website(url=f"https://{domain.domain}", domain=domain, active=False)
 
     def postprocess(self, results: OutputType, original_input: InputType) -> OutputType:
         for website in results:
@@ -1,6 +1,7 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Union
 import whois
-from spectragraph_core.utils import is_valid_domain
 from spectragraph_core.core.transform_base import Transform
 from spectragraph_types.domain import Domain, Domain
 from spectragraph_types.whois import Whois
@@ -8,6 +9,10 @@ from spectragraph_types.email import Email
 from spectragraph_core.core.logger import Logger
 from datetime import datetime
 
+# python-whois only offers blocking lookups, so they run on this pool. The
+# bound keeps a large domain list from flooding WHOIS servers on port 43.
+_WHOIS_POOL = ThreadPoolExecutor(max_workers=32, thread_name_prefix="whois")
+
 
 class WhoisTransform(Transform):
     """Scan for WHOIS information of a domain."""
@@ -29,26 +34,22 @@ class WhoisTransform(Transform):
         return "domain"
 
     def preprocess(self, data: Union[List[str], List[dict], InputType]) -> InputType:
-        cleaned: InputType = []
-        for item in data:
-            domain_obj = None
-            if isinstance(item, str):
-                if is_valid_domain(item):
-                    domain_obj = Domain(domain=item)
-            elif isinstance(item, dict) and "domain" in item:
-                if is_valid_domain(item["domain"]):
-                    domain_obj = Domain(domain=item["domain"])
-            elif isinstance(item, Domain):
-                domain_obj = item
-            if domain_obj:
-                cleaned.append(domain_obj)
-        return cleaned
+        return self._coerce_domains(data)
 
     async def scan(self, data: InputType) -> OutputType:
         results: OutputType = []
-        for domain in data:
+        loop = asyncio.get_running_loop()
+        lookups = await asyncio.gather(
+            *(
+                loop.run_in_executor(_WHOIS_POOL, whois.whois, domain.domain)
+                for domain in data
+            ),
+            return_exceptions=True,
+        )
+        for domain, whois_info in zip(data, lookups):
             try:
-                whois_info = whois.whois(domain.domain)
+                if isinstance(whois_info, Exception):
+                    raise whois_info
                 if whois_info:
                     # Extract emails from whois data
                     emails = []
@@ -1,10 +1,42 @@
+import asyncio
 import hashlib
-from typing import List, Union
-import requests
+from functools import lru_cache
+from typing import List, Optional, Tuple, Union
 from spectragraph_core.core.transform_base import Transform
 from spectragraph_core.core.logger import Logger
+from spectragraph_core.core.graph_serializer import GraphSerializer
 from spectragraph_types.email import Email
 from spectragraph_types.gravatar import Gravatar
+from tools.http_client import async_client
+
+_AVATAR_PREFIX = "https://www.gravatar.com/avatar/"
+_PROFILE_PREFIX = "https://www.gravatar.com/"
+
+# Bulk MERGE of emails, their gravatars and the HAS_GRAVATAR relationships
+_MERGE_GRAVATARS = """
+UNWIND $rows AS r
+MERGE (e:email {email: r.email, sketch_id: $sketch_id})
+ON CREATE SET e.created_at = $created_at
+SET e += r.email_props, e.type = "email", e.label = r.email
+MERGE (g:gravatar {gravatar_id: r.gravatar_id, sketch_id: $sketch_id})
+ON CREATE SET g.created_at = $created_at
+SET g += r.gravatar_props, g.type = "gravatar", g.label = r.gravatar_id
+MERGE (e)-[:HAS_GRAVATAR {sketch_id: $sketch_id}]->(g)
+"""
+
+
+@lru_cache(maxsize=1 << 16)
+def _gravatar_urls(email: str) -> Tuple[str, str, str]:
+    """Hash, avatar URL and profile URL of an email, built once per address.
+
+    Gravatar keys its avatars by the MD5 of the lowercased email.
+    """
+    email_hash = hashlib.md5(email.lower().encode()).digest().hex()
+    return (
+        email_hash,
+        _AVATAR_PREFIX + email_hash + "?d=404",
+        _PROFILE_PREFIX + email_hash + ".json",
+    )
 
 
 class EmailToGravatarTransform(Transform):
@@ -13,6 +45,11 @@ class EmailToGravatarTransform(Transform):
     InputType = List[Email]
     OutputType = List[Gravatar]
 
+    # Emails probed at once; each probe is one or two Gravatar requests
+    CONCURRENCY = 32
+    # Number of rows written per UNWIND query
+    BATCH_SIZE = 1000
+
     @classmethod
     def name(cls) -> str:
         return "email_to_gravatar"
@@ -30,7 +67,8 @@ class EmailToGravatarTransform(Transform):
         for item in data:
             email_obj = None
             if isinstance(item, str):
-                email_obj = Email(email=item)
+                # A str is all the model checks, so skip validation
+                email_obj = Email.model_construct(email=item)
             elif isinstance(item, dict) and "email" in item:
                 email_obj = Email(email=item["email"])
             elif isinstance(item, Email):
@@ -40,87 +78,84 @@ class EmailToGravatarTransform(Transform):
         return cleaned
 
     async def scan(self, data: InputType) -> OutputType:
-        results: OutputType = []
-
-        for email in data:
-            try:
-                # Generate MD5 hash of email
-                email_hash = hashlib.md5(email.email.lower().encode()).hexdigest()
-                # Query Gravatar API
-                gravatar_url = f"https://www.gravatar.com/avatar/{email_hash}?d=404"
-                Logger.warn(
-                    self.sketch_id,
-                    {"message": f"email url: {gravatar_url}"},
-                )
-                response = requests.head(gravatar_url, timeout=10)
-
-                if response.status_code == 200:
-                    # Gravatar found, get profile info
-                    profile_url = f"https://www.gravatar.com/{email_hash}.json"
-                    Logger.warn(
+        semaphore = asyncio.Semaphore(self.CONCURRENCY)
+
+        async def probe(email: Email) -> Optional[Gravatar]:
+            async with semaphore:
+                try:
+                    return await self._probe(email)
+                except Exception as e:
+                    Logger.error(
                         self.sketch_id,
-                        {"message": f"Gravatar url: {profile_url}"},
+                        {
+                            "message": f"Error checking Gravatar for email {email.email}: {e}"
+                        },
                     )
-                    profile_response = requests.get(profile_url, timeout=10)
-
-                    gravatar_data = {
-                        "src": gravatar_url,
-                        "hash": email_hash,
-                        "profile_url": profile_url,
-                        "exists": True,
-                    }
-
-                    if profile_response.status_code == 200:
-                        profile_data = profile_response.json()
-                        if "entry" in profile_data and profile_data["entry"]:
-                            entry = profile_data["entry"][0]
-                            gravatar_data.update(
-                                {
-                                    "display_name": entry.get("displayName"),
-                                    "about_me": entry.get("aboutMe"),
-                                    "location": entry.get("currentLocation"),
-                                }
-                            )
-
-                    gravatar = Gravatar(**gravatar_data)
-                    results.append(gravatar)
-
-            except Exception as e:
-                Logger.error(
-                    self.sketch_id,
+                    return None
+
+        gravatars = await asyncio.gather(*(probe(email) for email in data))
+        return [gravatar for gravatar in gravatars if gravatar is not None]
+
+    async def _probe(self, email: Email) -> Optional[Gravatar]:
+        """Return the Gravatar of an email, or None when it has none."""
+        client = async_client()
+        # MD5 hash of email and the Gravatar API URLs derived from it
+        email_hash, gravatar_url, profile_url = _gravatar_urls(email.email)
+        Logger.warn(
+            self.sketch_id,
+            {"message": f"email url: {gravatar_url}"},
+        )
+        response = await client.head(gravatar_url)
+        if response.status_code != 200:
+            return None
+
+        # Gravatar found, get profile info
+        Logger.warn(
+            self.sketch_id,
+            {"message": f"Gravatar url: {profile_url}"},
+        )
+        profile_response = await client.get(profile_url)
+
+        gravatar_data = {
+            "src": gravatar_url,
+            "hash": email_hash,
+            "profile_url": profile_url,
+            "exists": True,
+        }
+
+        if profile_response.status_code == 200:
+            profile_data = profile_response.json()
+            if "entry" in profile_data and profile_data["entry"]:
+                entry = profile_data["entry"][0]
+                gravatar_data.update(
                     {
-                        "message": f"Error checking Gravatar for email {email.email}: {e}"
-                    },
+                        "display_name": entry.get("displayName"),
+                        "about_me": entry.get("aboutMe"),
+                        "location": entry.get("currentLocation"),
+                    }
                 )
-                continue
 
-        return results
+        return Gravatar(**gravatar_data)
 
     def postprocess(self, results: OutputType, original_input: InputType) -> OutputType:
-        for email_obj, gravatar_obj in zip(original_input, results):
-            if not self.neo4j_conn:
-                continue
-
-            # Create email node
-            self.create_node("email", "email", email_obj.email, **email_obj.__dict__)
-
-            # Create gravatar node
-            gravatar_key = f"{email_obj.email}_{self.sketch_id}"
-            self.create_node(
-                "gravatar", "gravatar_id", gravatar_key, **gravatar_obj.__dict__
-            )
-
-            # Create relationship between email and gravatar
-            self.create_relationship(
-                "email",
-                "email",
-                email_obj.email,
-                "gravatar",
-                "gravatar_id",
-                gravatar_key,
-                "HAS_GRAVATAR",
-            )
+        if not self.neo4j_conn:
+            return results
+
+        # Write every email, gravatar and relationship with UNWIND
+        rows = [
+            {
+                "email": email_obj.email,
+                "email_props": GraphSerializer.serialize_properties(email_obj.__dict__),
+                "gravatar_id": f"{email_obj.email}_{self.sketch_id}",
+                "gravatar_props": GraphSerializer.serialize_properties(
+                    gravatar_obj.__dict__
+                ),
+            }
+            for email_obj, gravatar_obj in zip(original_input, results)
+        ]
+        self.bulk_merge([(_MERGE_GRAVATARS, rows)], self.BATCH_SIZE)
 
+        for email_obj, gravatar_obj in zip(original_input, results):
             self.log_graph_message(
                 f"Gravatar found for email {email_obj.email} -> hash: {gravatar_obj.hash}"
             )
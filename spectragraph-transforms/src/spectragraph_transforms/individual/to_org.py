@@ -59,10 +59,14 @@ class IndividualToOrgTransform(Transform):
     async def scan(self, data: InputType) -> OutputType:
 
         results: OutputType = []
-        for individual in data:
+        sirene = SireneTool()
+        batches = await sirene.launch_many(
+            [individual.full_name for individual in data], limit=25
+        )
+        for individual, raw_orgs in zip(data, batches):
             try:
-                sirene = SireneTool()
-                raw_orgs = sirene.launch(individual.full_name, limit=25)
+                if isinstance(raw_orgs, Exception):
+                    raise raw_orgs
                 if len(raw_orgs) > 0:
                     for org_dict in raw_orgs:
                         enriched_org = self.enrich_org(org_dict)
@@ -5,10 +5,51 @@ from spectragraph_core.core.transform_base import Transform
 from spectragraph_core.core.graph_db import Neo4jConnection
 from spectragraph_types.ip import Ip
 from spectragraph_types.asn import ASN
-from spectragraph_core.utils import is_valid_ip
 from spectragraph_core.core.logger import Logger
+from spectragraph_core.core.graph_serializer import GraphSerializer
+from tools.cache import TTLCache
 from tools.network.asnmap import AsnmapTool
 
+# asnmap results by IP, shared by every scan of the process: allocations
+# rarely change and each lookup otherwise costs a container run
+_asn_cache = TTLCache(maxsize=100_000, ttl=24 * 3600)
+
+# Bulk MERGE of IPs, their ASNs and the BELONGS_TO relationships
+_MERGE_ASNS = """
+UNWIND $rows AS r
+MERGE (i:ip {address: r.address, sketch_id: $sketch_id})
+ON CREATE SET i.created_at = $created_at
+SET i += r.ip_props, i.type = "ip", i.label = r.address
+MERGE (a:asn {number: r.number, sketch_id: $sketch_id})
+ON CREATE SET a.created_at = $created_at
+SET a += r.asn_props, a.type = "asn", a.label = "AS" + toString(r.number)
+MERGE (i)-[:BELONGS_TO {sketch_id: $sketch_id}]->(a)
+"""
+
+
+def _lookup_asns(
+    addresses: List[str], api_key: Optional[str]
+) -> Dict[str, Dict[str, Any]]:
+    """asnmap result of each address, running asnmap only for uncached ones."""
+    results: Dict[str, Dict[str, Any]] = {}
+    missing = []
+    for address in dict.fromkeys(addresses):
+        cached = _asn_cache.get(address)
+        if cached is not None:
+            results[address] = cached
+        else:
+            missing.append(address)
+    if missing:
+        found = AsnmapTool().launch_many(missing, type="ip", api_key=api_key)
+        for address in missing:
+            asn_data = found.get(address)
+            # An empty answer may be a rate limit or a bad key rather than an
+            # unallocated address, so only hits are cached
+            if asn_data:
+                _asn_cache.set(address, asn_data)
+            results[address] = asn_data or {}
+    return results
+
 
 class IpToAsnTransform(Transform):
     """[ASNMAP] Takes an IP address and returns its corresponding ASN."""
@@ -17,6 +58,9 @@ class IpToAsnTransform(Transform):
     InputType = List[Ip]
     OutputType = List[ASN]
 
+    # Number of rows written per UNWIND query
+    BATCH_SIZE = 1000
+
     def __init__(
         self,
         sketch_id: Optional[str] = None,
@@ -63,32 +107,28 @@ class IpToAsnTransform(Transform):
         return "address"
 
     def preprocess(self, data: Union[List[str], List[dict], InputType]) -> InputType:
-        cleaned: InputType = []
-        for item in data:
-            ip_obj = None
-            if isinstance(item, str):
-                if is_valid_ip(item):
-                    ip_obj = Ip(address=item)
-            elif isinstance(item, dict) and "address" in item:
-                if is_valid_ip(item["address"]):
-                    ip_obj = Ip(address=item["address"])
-            elif isinstance(item, Ip):
-                ip_obj = item
-            if ip_obj:
-                cleaned.append(ip_obj)
-        return cleaned
+        return self._coerce_ips(data)
 
     async def scan(self, data: InputType) -> OutputType:
         results: OutputType = []
-        asnmap = AsnmapTool()
 
         # Retrieve API key from vault or environment
         api_key = self.get_secret("PDCP_API_KEY", os.getenv("PDCP_API_KEY"))
 
+        try:
+            # One asnmap run covers every uncached IP instead of one
+            # container per IP
+            asn_by_ip = _lookup_asns([ip.address for ip in data], api_key)
+        except Exception as e:
+            Logger.error(
+                self.sketch_id,
+                {"message": f"Error getting ASNs for {len(data)} IPs: {e}"},
+            )
+            return results
+
         for ip in data:
             try:
-                # Use asnmap tool to get ASN info, passing the API key
-                asn_data = asnmap.launch(ip.address, type="ip", api_key=api_key)
+                asn_data = asn_by_ip.get(ip.address, {})
                 if asn_data and "as_number" in asn_data:
                     # Parse ASN number from string like "AS16276" to integer 16276
                     asn_string = asn_data["as_number"]
@@ -128,21 +168,19 @@ class IpToAsnTransform(Transform):
     ) -> OutputType:
         # Create Neo4j relationships between IPs and their corresponding ASNs
         if input_data and self.neo4j_conn:
+            # Write every IP, ASN and relationship with UNWIND
+            rows = [
+                {
+                    "address": ip.address,
+                    "ip_props": GraphSerializer.serialize_properties(ip.__dict__),
+                    "number": asn.number,
+                    "asn_props": GraphSerializer.serialize_properties(asn.__dict__),
+                }
+                for ip, asn in zip(input_data, results)
+            ]
+            self.bulk_merge([(_MERGE_ASNS, rows)], self.BATCH_SIZE)
+
             for ip, asn in zip(input_data, results):
-                # Create IP node
-                self.create_node("ip", "address", ip.address, label=ip.address, type="ip", **ip.__dict__)
-                # Create ASN node
-                self.create_node("asn", "number", asn.number, label=f"AS{asn.number}", type="asn", **asn.__dict__)
-                # Create relationship
-                self.create_relationship(
-                    "ip",
-                    "address",
-                    ip.address,
-                    "asn",
-                    "number",
-                    asn.number,
-                    "BELONGS_TO",
-                )
                 self.log_graph_message(
                     f"IP {ip.address} belongs to AS{asn.number} ({asn.name})"
                 )
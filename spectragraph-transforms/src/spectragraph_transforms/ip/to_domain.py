@@ -6,7 +6,6 @@ from spectragraph_core.core.logger import Logger
 from spectragraph_core.core.transform_base import Transform
 from spectragraph_types.domain import Domain
 from spectragraph_types.ip import Ip
-from spectragraph_core.utils import is_valid_ip
 
 PTR_BLACKLIST = re.compile(r"^ip\d+\.ip-\d+-\d+-\d+-\d+\.")
 
@@ -31,20 +30,7 @@ class ReverseResolveTransform(Transform):
         return "address"
 
     def preprocess(self, data: Union[List[str], List[dict], InputType]) -> InputType:
-        cleaned: InputType = []
-        for item in data:
-            ip_obj = None
-            if isinstance(item, str):
-                if is_valid_ip(item):
-                    ip_obj = Ip(address=item)
-            elif isinstance(item, dict) and "address" in item:
-                if is_valid_ip(item["address"]):
-                    ip_obj = Ip(address=item["address"])
-            elif isinstance(item, Ip):
-                ip_obj = item
-            if ip_obj:
-                cleaned.append(ip_obj)
-        return cleaned
+        return self._coerce_ips(data)
 
     async def scan(self, data: InputType) -> OutputType:
         results: OutputType = []
@@ -3,7 +3,7 @@ from typing import List, Dict, Any, TypeAlias, Union
 from pydantic import TypeAdapter
 from spectragraph_core.core.transform_base import Transform
 from spectragraph_types.ip import Ip, Ip
-from spectragraph_core.utils import resolve_type, is_valid_ip
+from spectragraph_core.utils import resolve_type
 
 InputType: TypeAlias = List[Ip]
 OutputType: TypeAlias = List[Ip]
@@ -55,18 +55,7 @@ class IpToInfosTransform(Transform):
         }
 
     def preprocess(self, data: Union[List[str], List[dict], InputType]) -> InputType:
-        cleaned: InputType = []
-        for item in data:
-            ip_obj = None
-            if isinstance(item, str):
-                ip_obj = Ip(address=item)
-            elif isinstance(item, dict) and "address" in item:
-                ip_obj = Ip(address=item["address"])
-            elif isinstance(item, Ip):
-                ip_obj = item
-            if ip_obj and is_valid_ip(ip_obj.address):
-                cleaned.append(ip_obj)
-        return cleaned
+        return self._coerce_ips(data)
 
     async def scan(self, data: InputType) -> OutputType:
         results: OutputType = []
@@ -40,10 +40,12 @@ class OrgToInfosTransform(Transform):
     async def scan(self, data: InputType) -> OutputType:
 
         results: OutputType = []
-        for org in data:
+        sirene = SireneTool()
+        batches = await sirene.launch_many([org.name for org in data], limit=25)
+        for org, raw_orgs in zip(data, batches):
             try:
-                sirene = SireneTool()
-                raw_orgs = sirene.launch(org.name, limit=25)
+                if isinstance(raw_orgs, Exception):
+                    raise raw_orgs
                 if len(raw_orgs) > 0:
                     for org_dict in raw_orgs:
                         enriched_org = self.enrich_org(org_dict)
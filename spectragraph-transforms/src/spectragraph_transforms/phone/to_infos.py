@@ -4,7 +4,7 @@ from spectragraph_core.core.transform_base import Transform
 from spectragraph_core.utils import is_valid_number
 from spectragraph_core.core.logger import Logger
 from spectragraph_types.phone import Phone
-import httpx
+from tools.http_client import async_client
 
 
 class IgnorantTransform(Transform):
@@ -72,21 +72,21 @@ class IgnorantTransform(Transform):
             from ignorant.modules.social_media.instagram import instagram
             from ignorant.modules.social_media.snapchat import snapchat
 
-            # Create an HTTP client for asynchronous requests
-            async with httpx.AsyncClient() as client:
-                results = []
-                modules = [amazon, snapchat, instagram]
+            # Reuse the shared pooled client rather than one per phone number
+            client = async_client()
+            results = []
+            modules = [amazon, snapchat, instagram]
 
-                # Execute the modules in parallel
-                tasks = [module(phone, "+33", client) for module in modules]
-                responses = await asyncio.gather(*tasks)
+            # Execute the modules in parallel
+            tasks = [module(phone, "+33", client) for module in modules]
+            responses = await asyncio.gather(*tasks)
 
-                # Add results from each module
-                for response in responses:
-                    if response:
-                        results.append(response)
+            # Add results from each module
+            for response in responses:
+                if response:
+                    results.append(response)
 
-                return {"number": phone, "platforms": results}
+            return {"number": phone, "platforms": results}
 
         except Exception as e:
             return {"number": phone, "error": f"Error in Ignorant research: {str(e)}"}
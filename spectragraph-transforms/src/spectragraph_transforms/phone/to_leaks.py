@@ -97,11 +97,7 @@ class PhoneToBreachesTransform(Transform):
             try:
                 # Query Have I Been Pwned API
                 full_url = urljoin(api_url, f"{phone.number}?truncateResponse=false")
-                Logger.error(self.sketch_id, {"message": f"full url: {full_url}"})
                 response = requests.get(full_url, headers=headers, timeout=10)
-                Logger.info(
-                    self.sketch_id, {"message": f"HIBP API response: {response.json()}"}
-                )
                 if response.status_code == 200:
                     breaches_data = response.json()
                     Logger.info(
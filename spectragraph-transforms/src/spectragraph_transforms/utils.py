@@ -15,6 +15,20 @@ from pydantic import BaseModel, TypeAdapter
 
 
 def is_valid_ip(address: str) -> bool:
+    # inet_pton is a direct libc call, much cheaper than building an
+    # ipaddress object when only a boolean is needed. It rejects scoped IPv6
+    # addresses ("fe80::1%eth0"), so those still go through ipaddress.
+    if isinstance(address, str) and "%" not in address:
+        try:
+            socket.inet_pton(socket.AF_INET, address)
+            return True
+        except (OSError, ValueError):
+            pass
+        try:
+            socket.inet_pton(socket.AF_INET6, address)
+            return True
+        except (OSError, ValueError):
+            return False
     try:
         ipaddress.ip_address(address)
         return True
@@ -34,9 +48,18 @@ def is_valid_email(email: str) -> bool:
     return True
 
 
+# Compiled once: is_valid_domain runs for every item of every domain list
+_DOMAIN_RE = re.compile(r"^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+
 def is_valid_domain(url_or_domain: str) -> str:
 
     try:
+        # Bare hostnames are the common case and need no URL parsing. Anything
+        # else, including whitespace urlparse would strip, takes the full path.
+        if _DOMAIN_RE.fullmatch(url_or_domain):
+            return True
+
         parsed = urlparse(
             url_or_domain if "://" in url_or_domain else "http://" + url_or_domain
         )
@@ -45,7 +68,7 @@ def is_valid_domain(url_or_domain: str) -> str:
         if not hostname or "." not in hostname:
             return False
 
-        if not re.match(r"^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", hostname):
+        if not _DOMAIN_RE.match(hostname):
             return False
 
         return True
@@ -44,18 +44,7 @@ class WebsiteToCrawler(Transform):
             return False
 
     def preprocess(self, data: Union[List[str], List[dict], InputType]) -> InputType:
-        cleaned: InputType = []
-        for item in data:
-            website_obj = None
-            if isinstance(item, str):
-                website_obj = Website(url=item)
-            elif isinstance(item, dict) and "url" in item:
-                website_obj = Website(url=item["url"])
-            elif isinstance(item, Website):
-                website_obj = item
-            if website_obj:
-                cleaned.append(website_obj)
-        return cleaned
+        return self._coerce_websites(data)
 
     async def scan(self, data: InputType) -> OutputType:
         """Crawl websites to extract emails and phone numbers."""
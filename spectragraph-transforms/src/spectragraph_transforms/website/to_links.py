@@ -1,10 +1,80 @@
-from typing import List, Union
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 from urllib.parse import urlparse
+from neo4j.exceptions import TransientError
 from spectragraph_core.core.transform_base import Transform
 from spectragraph_types.website import Website
 from spectragraph_core.core.logger import Logger
+from spectragraph_core.core.enums import EventLevel
+from spectragraph_core.core.graph_db import Neo4jConnection
+from spectragraph_core.core.vault import VaultProtocol
 from reconspread import Crawler
 
+# Bulk MERGE queries used to flush crawl results
+_UNWIND_ROWS = "UNWIND $rows AS r\n"
+
+_MERGE_WEBSITES = """
+UNWIND $rows AS r
+MERGE (n:website {url: r.url, sketch_id: $sketch_id})
+ON CREATE SET n.created_at = $created_at
+SET n.type = "website", n.label = r.url, n.caption = r.url
+"""
+
+_MERGE_DOMAINS = """
+UNWIND $rows AS r
+MERGE (n:domain {name: r.name, sketch_id: $sketch_id})
+ON CREATE SET n.created_at = $created_at
+SET n.type = "domain", n.label = r.name, n.caption = r.name
+"""
+
+_MERGE_LINKS = {
+    "LINKS_TO": """
+UNWIND $rows AS r
+MATCH (from:website {url: r.source, sketch_id: $sketch_id})
+MATCH (to:website {url: r.target, sketch_id: $sketch_id})
+MERGE (from)-[:LINKS_TO {sketch_id: $sketch_id}]->(to)
+""",
+    "BELONGS_TO_DOMAIN": """
+UNWIND $rows AS r
+MATCH (from:website {url: r.source, sketch_id: $sketch_id})
+MATCH (to:domain {name: r.target, sketch_id: $sketch_id})
+MERGE (from)-[:BELONGS_TO_DOMAIN {sketch_id: $sketch_id}]->(to)
+""",
+    "LINKS_TO_DOMAIN": """
+UNWIND $rows AS r
+MATCH (from:website {url: r.source, sketch_id: $sketch_id})
+MATCH (to:domain {name: r.target, sketch_id: $sketch_id})
+MERGE (from)-[:LINKS_TO_DOMAIN {sketch_id: $sketch_id}]->(to)
+""",
+}
+_LINK_TYPES = {query: rel_type for rel_type, query in _MERGE_LINKS.items()}
+
+# Server-side batching for flushes too large for a single transaction. The
+# action statement is one of the MERGE queries above without its UNWIND.
+# APOC reports failed batches in its result row instead of raising.
+_APOC_ITERATE = """
+CALL apoc.periodic.iterate(
+    "UNWIND $rows AS r RETURN r",
+    $action,
+    {
+        batchSize: $batch_size,
+        parallel: $parallel,
+        retries: $retries,
+        params: {rows: $rows, sketch_id: $sketch_id, created_at: $created_at}
+    }
+)
+YIELD batches, failedBatches, errorMessages
+RETURN batches, failedBatches, errorMessages
+"""
+
+_DEADLOCK_DETECTED = "Neo.TransientError.Transaction.DeadlockDetected"
+
+# Node (label, key) pairs the queries above merge on
+_MERGE_KEYS = [("website", "url"), ("domain", "name")]
+
 
 class WebsiteToLinks(Transform):
     """From website to spread crawler that extracts domains and internal/external links."""
@@ -13,6 +83,55 @@ class WebsiteToLinks(Transform):
     InputType = List[Website]
     OutputType = List[Website]
 
+    # Number of pending rows that triggers a flush to Neo4j
+    BATCH_SIZE = 1000
+    # Number of websites crawled concurrently
+    MAX_WORKERS = 8
+    # Row count above which a query is written with apoc.periodic.iterate
+    # instead of inline in the flush transaction
+    APOC_THRESHOLD = 5000
+    # Attempts for an APOC write that hits a deadlock
+    APOC_RETRIES = 3
+    # Number of buffered log messages that triggers a write to the log table
+    LOG_BATCH_SIZE = 100
+    # Flushes queued to the writer thread before the crawler waits for one
+    MAX_PENDING_WRITES = 4
+
+    def __init__(
+        self,
+        sketch_id: Optional[str] = None,
+        scan_id: Optional[str] = None,
+        neo4j_conn: Optional[Neo4jConnection] = None,
+        params_schema: Optional[List[Dict[str, Any]]] = None,
+        vault: Optional[VaultProtocol] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__(sketch_id, scan_id, neo4j_conn, params_schema, vault, params)
+        self._pending_websites: List[Dict[str, Any]] = []
+        self._pending_domains: List[Dict[str, Any]] = []
+        self._pending_links: Dict[str, List[Dict[str, Any]]] = {
+            rel_type: [] for rel_type in _MERGE_LINKS
+        }
+        # Nodes and relationships already written during this scan, so the
+        # links repeated on every page (menus, pagination) are merged once
+        self._seen_nodes: set[tuple[str, str]] = set()
+        self._seen_rels: set[tuple[str, str, str]] = set()
+        # Per-URL log messages, written with one commit per batch
+        self._log_buffer: List[Tuple[EventLevel, Dict[str, Any]]] = []
+        # Crawler callbacks run in worker threads, so queueing and flushing
+        # must not interleave
+        self._write_lock = threading.RLock()
+        # During a scan, flushes triggered by the crawler are written by a
+        # single background thread so batches land in order while the
+        # crawl goes on
+        self._writer: Optional[ThreadPoolExecutor] = None
+        self._in_flight: List[Future] = []
+        # First error from the writer thread, raised by scan once the crawls
+        # are done rather than in whichever crawl happens to wait on it
+        self._write_error: Optional[Exception] = None
+        # Serializes inline flushes made outside a scan
+        self._flush_lock = threading.Lock()
+
     @classmethod
     def name(cls) -> str:
         return "website_to_links"
@@ -25,7 +144,9 @@ class WebsiteToLinks(Transform):
     def key(cls) -> str:
         return "url"
 
-    def extract_domain(self, url: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=100_000)
+    def extract_domain(url: str) -> str:
         """Extract domain from URL."""
         try:
             parsed_url = urlparse(url)
@@ -33,273 +154,420 @@ class WebsiteToLinks(Transform):
         except Exception:
             return ""
 
-    def preprocess(self, data: Union[List[str], List[dict], InputType]) -> InputType:
-        cleaned: InputType = []
-        for item in data:
-            website_obj = None
-            if isinstance(item, str):
-                website_obj = Website(url=item)
-            elif isinstance(item, dict) and "url" in item:
-                website_obj = Website(url=item["url"])
-            elif isinstance(item, Website):
-                website_obj = item
-            if website_obj:
-                cleaned.append(website_obj)
-        return cleaned
+    def _queue_website(self, url: str) -> None:
+        key = ("website", url)
+        # Seen-check and append share one lock section, so no other crawl
+        # can queue a relationship to this node before its row is pending
+        with self._write_lock:
+            if key in self._seen_nodes:
+                return
+            self._seen_nodes.add(key)
+            self._pending_websites.append({"url": url})
+            full = len(self._pending_websites) >= self.BATCH_SIZE
+        if full:
+            self._flush_in_background()
 
-    async def scan(self, data: InputType) -> OutputType:
-        """Crawl websites using reconspread to extract internal and external links."""
-        results = []
+    def _queue_domain(self, name: str) -> None:
+        key = ("domain", name)
+        with self._write_lock:
+            if key in self._seen_nodes:
+                return
+            self._seen_nodes.add(key)
+            self._pending_domains.append({"name": name})
+            full = len(self._pending_domains) >= self.BATCH_SIZE
+        if full:
+            self._flush_in_background()
+
+    def _queue_link(self, source: str, target: str, rel_type: str) -> None:
+        key = (source, target, rel_type)
+        with self._write_lock:
+            if key in self._seen_rels:
+                return
+            self._seen_rels.add(key)
+            self._pending_links[rel_type].append({"source": source, "target": target})
+            full = len(self._pending_links[rel_type]) >= self.BATCH_SIZE
+        if full:
+            self._flush_in_background()
+
+    def _buffer_log(self, level: EventLevel, message: str) -> None:
+        with self._write_lock:
+            self._log_buffer.append((level, {"message": message}))
+            if len(self._log_buffer) < self.LOG_BATCH_SIZE:
+                return
+        self._flush_logs()
+
+    def _flush_logs(self) -> None:
+        with self._write_lock:
+            entries, self._log_buffer = self._log_buffer, []
+        Logger.log_many(self.sketch_id, entries)
 
-        for website in data:
+    def _take_pending(self) -> List[Tuple[str, List[Dict[str, Any]], bool]]:
+        """Detach the pending rows as (query, rows, parallel) writes."""
+        with self._write_lock:
+            # Nodes first so the relationship MATCHes can find them.
+            # Relationship writes are not run in parallel: they all lock the
+            # crawled website node and would deadlock each other.
+            writes = [
+                (_MERGE_WEBSITES, self._pending_websites, True),
+                (_MERGE_DOMAINS, self._pending_domains, True),
+            ] + [
+                (_MERGE_LINKS[rel_type], rows, False)
+                for rel_type, rows in self._pending_links.items()
+            ]
+            self._pending_websites = []
+            self._pending_domains = []
+            self._pending_links = {rel_type: [] for rel_type in _MERGE_LINKS}
+        return [write for write in writes if write[1]]
+
+    def _write(self, writes: List[Tuple[str, List[Dict[str, Any]], bool]]) -> None:
+        """Write detached rows to Neo4j in one transaction."""
+        if all(len(rows) <= self.APOC_THRESHOLD for _, rows, _ in writes):
+            self.bulk_merge(
+                [(query, rows) for query, rows, _ in writes],
+                self.APOC_THRESHOLD,
+                indexes=_MERGE_KEYS,
+            )
+            return
+        self.ensure_indexes(_MERGE_KEYS)
+        params = self.bulk_params()
+        for query, rows, parallel in writes:
+            if len(rows) > self.APOC_THRESHOLD:
+                self._bulk_write_via_apoc(query, rows, params, parallel)
+            else:
+                self.bulk_merge([(query, rows)], self.APOC_THRESHOLD)
+
+    def _forget(self, writes: List[Tuple[str, List[Dict[str, Any]], bool]]) -> None:
+        """Drop unwritten rows from the seen-sets so they can be queued again."""
+        with self._write_lock:
+            for query, rows, _ in writes:
+                if query == _MERGE_WEBSITES:
+                    self._seen_nodes.difference_update(
+                        ("website", row["url"]) for row in rows
+                    )
+                elif query == _MERGE_DOMAINS:
+                    self._seen_nodes.difference_update(
+                        ("domain", row["name"]) for row in rows
+                    )
+                else:
+                    rel_type = _LINK_TYPES[query]
+                    self._seen_rels.difference_update(
+                        (row["source"], row["target"], rel_type) for row in rows
+                    )
+
+    def _write_in_background(
+        self, writes: List[Tuple[str, List[Dict[str, Any]], bool]]
+    ) -> None:
+        """Writer thread task: record a failed write instead of raising it."""
+        try:
+            self._write(writes)
+        except Exception as e:
+            self._forget(writes)
+            with self._write_lock:
+                if self._write_error is None:
+                    self._write_error = e
+
+    def _flush(self) -> None:
+        """Write pending nodes and relationships to Neo4j and wait for them.
+
+        The lock is only held to detach rows and futures, never while waiting
+        on Neo4j, so crawler callbacks keep queueing in the meantime.
+        """
+        if not self.neo4j_conn:
+            return
+
+        with self._write_lock:
+            writer = self._writer
+            if writer is not None:
+                writes = self._take_pending()
+                if writes:
+                    self._in_flight.append(
+                        writer.submit(self._write_in_background, writes)
+                    )
+                in_flight, self._in_flight = self._in_flight, []
+
+        if writer is None:
+            # No scan running: write inline. Taking the rows under the flush
+            # lock keeps concurrent flushes in order, nodes before the
+            # relationships that MATCH them.
+            with self._flush_lock:
+                writes = self._take_pending()
+                if writes:
+                    try:
+                        self._write(writes)
+                    except Exception:
+                        self._forget(writes)
+                        raise
+            return
+
+        # The writer thread runs batches in submission order. Failures are
+        # kept in _write_error, so these never raise.
+        for future in in_flight:
+            future.result()
+
+    def _flush_in_background(self) -> None:
+        """Hand the pending rows to the writer thread, if a scan is running.
+
+        The crawler thread only waits when MAX_PENDING_WRITES flushes are
+        already queued, and then without holding the lock.
+        """
+        if not self.neo4j_conn:
+            return
+
+        oldest = None
+        with self._write_lock:
+            writer = self._writer
+            if writer is not None:
+                writes = self._take_pending()
+                if not writes:
+                    return
+                if len(self._in_flight) >= self.MAX_PENDING_WRITES:
+                    oldest = self._in_flight.pop(0)
+                self._in_flight.append(writer.submit(self._write_in_background, writes))
+
+        if writer is None:
+            self._flush()
+        elif oldest is not None:
+            oldest.result()
+
+    def _bulk_write_via_apoc(
+        self,
+        query: str,
+        rows: List[Dict[str, Any]],
+        params: Dict[str, Any],
+        parallel: bool,
+    ) -> None:
+        """Write rows with apoc.periodic.iterate, retrying on deadlocks.
+
+        APOC retries deadlocked batches itself; batches that still fail are
+        only reported in the result row, so they are raised here.
+        """
+        apoc_params = {
+            **params,
+            "rows": rows,
+            "action": query.replace(_UNWIND_ROWS, "", 1),
+            "batch_size": self.BATCH_SIZE,
+            "parallel": parallel,
+            "retries": self.APOC_RETRIES,
+        }
+        for attempt in range(1, self.APOC_RETRIES + 1):
             try:
-                Logger.info(
+                stats = self.neo4j_conn.query(_APOC_ITERATE, apoc_params)[0]
+                break
+            except TransientError as e:
+                if e.code != _DEADLOCK_DETECTED or attempt == self.APOC_RETRIES:
+                    raise
+                Logger.warn(
                     self.sketch_id,
-                    {"message": f"Starting reconspread crawl of {str(website.url)}"},
+                    {
+                        "message": "Deadlock while writing crawl results, "
+                        f"retrying ({attempt}/{self.APOC_RETRIES})"
+                    },
                 )
+        if stats["failedBatches"]:
+            raise RuntimeError(
+                f"{stats['failedBatches']} of {stats['batches']} batches failed "
+                f"writing crawl results: {stats['errorMessages']}"
+            )
+
+    def preprocess(self, data: Union[List[str], List[dict], InputType]) -> InputType:
+        return self._coerce_websites(data)
 
-                # Extract main domain from input website (needed in callback)
-                main_domain = self.extract_domain(str(website.url))
-
-                # Create main website and domain nodes upfront
-                if self.neo4j_conn:
-                    self.create_node(
-                        "website",
-                        "url",
-                        str(website.url),
-                        caption=str(website.url),
-                        type="website",
+    async def _process_one(self, website: Website) -> Dict[str, Any]:
+        """Crawl a single website and queue its links for writing."""
+        # Serializing a pydantic URL is not free, do it once per website
+        url_str = str(website.url)
+        try:
+            Logger.info(
+                self.sketch_id,
+                {"message": f"Starting reconspread crawl of {url_str}"},
+            )
+
+            # Extract main domain from input website (needed in callback)
+            main_domain = self.extract_domain(url_str)
+
+            # Queue main website and domain nodes upfront
+            if self.neo4j_conn:
+                self._queue_website(url_str)
+                if main_domain:
+                    self._queue_domain(main_domain)
+                    self._queue_link(url_str, main_domain, "BELONGS_TO_DOMAIN")
+                    self.log_graph_message(
+                        f"Website {url_str} belongs to domain {main_domain}"
                     )
-                    if main_domain:
-                        self.create_node(
-                            "domain",
-                            "name",
-                            main_domain,
-                            caption=main_domain,
-                            type="domain",
-                        )
-                        self.create_relationship(
-                            "website",
-                            "url",
-                            str(website.url),
-                            "domain",
-                            "name",
-                            main_domain,
-                            "BELONGS_TO_DOMAIN",
-                        )
-                        self.log_graph_message(
-                            f"Website {str(website.url)} belongs to domain {main_domain}"
-                        )
 
-                # Store discovered URLs
-                internal_urls = []
-                external_urls = []
-                external_domains = set()
-
-                def url_handler(url, is_external=False):
-                    """Custom callback to handle URLs as they're discovered."""
-                    if is_external:
-                        external_urls.append(url)
-                        domain = self.extract_domain(url)
-                        if domain:
-                            external_domains.add(domain)
-                            # Create external website node immediately
-                            if self.neo4j_conn:
-                                self.create_node(
-                                    "website", "url", url, caption=url, type="website"
-                                )
-                                self.create_relationship(
-                                    "website",
-                                    "url",
-                                    str(website.url),
-                                    "website",
-                                    "url",
-                                    url,
-                                    "LINKS_TO",
-                                )
-                                self.log_graph_message(
-                                    f"Website {str(website.url)} links to external website {url}"
-                                )
+            # Store discovered URLs
+            internal_urls: set[str] = set()
+            external_urls: set[str] = set()
+            external_domains: set[str] = set()
 
-                                # Create external domain node and link external website to its domain
-                                if domain != main_domain:
-                                    self.create_node(
-                                        "domain",
-                                        "name",
-                                        domain,
-                                        caption=domain,
-                                        type="domain",
-                                    )
-                                    self.create_relationship(
-                                        "website",
-                                        "url",
-                                        url,
-                                        "domain",
-                                        "name",
-                                        domain,
-                                        "BELONGS_TO_DOMAIN",
-                                    )
-                                    self.create_relationship(
-                                        "website",
-                                        "url",
-                                        str(website.url),
-                                        "domain",
-                                        "name",
-                                        domain,
-                                        "LINKS_TO_DOMAIN",
-                                    )
-                                    self.log_graph_message(
-                                        f"External website {url} belongs to domain {domain}"
-                                    )
-                                    self.log_graph_message(
-                                        f"Website {str(website.url)} links to external domain {domain}"
-                                    )
-                        Logger.info(
-                            self.sketch_id,
-                            {"message": f"[EXTERNAL] Found: {url} -> Domain: {domain}"},
-                        )
-                    else:
-                        internal_urls.append(url)
-                        # Create internal website node immediately
-                        if self.neo4j_conn and url != str(
-                            website.url
-                        ):  # Don't create duplicate of main website
-                            self.create_node(
-                                "website", "url", url, caption=url, type="website"
-                            )
-                            self.create_relationship(
-                                "website",
-                                "url",
-                                str(website.url),
-                                "website",
-                                "url",
-                                url,
-                                "LINKS_TO",
-                            )
-                            self.log_graph_message(
-                                f"Website {str(website.url)} links to internal website {url}"
+            # The callback runs for every URL found: bind what it uses to
+            # closure locals once instead of looking it up on self each call
+            write_graph = bool(self.neo4j_conn)
+            extract_domain = self.extract_domain
+            queue_website = self._queue_website
+            queue_domain = self._queue_domain
+            queue_link = self._queue_link
+            buffer_log = self._buffer_log
+            graph_append = EventLevel.GRAPH_APPEND
+            info = EventLevel.INFO
+
+            def url_handler(url, is_external=False):
+                """Custom callback to handle URLs as they're discovered."""
+                if is_external:
+                    external_urls.add(url)
+                    domain = extract_domain(url)
+                    if domain:
+                        external_domains.add(domain)
+                        # Queue external website node
+                        if write_graph:
+                            queue_website(url)
+                            queue_link(url_str, url, "LINKS_TO")
+                            buffer_log(
+                                graph_append,
+                                f"Website {url_str} links to external website {url}",
                             )
 
-                            # Also link internal websites to main domain
-                            if main_domain:
-                                self.create_relationship(
-                                    "website",
-                                    "url",
-                                    url,
-                                    "domain",
-                                    "name",
-                                    main_domain,
-                                    "BELONGS_TO_DOMAIN",
+                            # Queue external domain node and link external website to its domain
+                            if domain != main_domain:
+                                queue_domain(domain)
+                                queue_link(url, domain, "BELONGS_TO_DOMAIN")
+                                queue_link(url_str, domain, "LINKS_TO_DOMAIN")
+                                buffer_log(
+                                    graph_append,
+                                    f"External website {url} belongs to domain {domain}",
+                                )
+                                buffer_log(
+                                    graph_append,
+                                    f"Website {url_str} links to external domain {domain}",
                                 )
-                        Logger.info(
-                            self.sketch_id, {"message": f"[INTERNAL] Found: {url}"}
+                    buffer_log(
+                        info,
+                        f"[EXTERNAL] Found: {url} -> Domain: {domain}",
+                    )
+                else:
+                    internal_urls.add(url)
+                    # Queue internal website node
+                    # Don't create duplicate of main website
+                    if write_graph and url != url_str:
+                        queue_website(url)
+                        queue_link(url_str, url, "LINKS_TO")
+                        buffer_log(
+                            graph_append,
+                            f"Website {url_str} links to internal website {url}",
                         )
 
-                # Create crawler with custom callback
-                crawler = Crawler(
-                    url=str(website.url),
-                    recursive=True,
-                    same_domain_only=False,
-                    verbose=False,  # Disable default verbose output
-                    _on_result_callback=url_handler,  # Use our custom handler
-                )
+                        # Also link internal websites to main domain
+                        if main_domain:
+                            queue_link(url, main_domain, "BELONGS_TO_DOMAIN")
+                    buffer_log(info, f"[INTERNAL] Found: {url}")
 
-                # Perform the crawl
-                crawler.fetch()
-                crawler.extract_urls()
-
-                # Get final results (backup in case callback missed anything)
-                crawl_results = crawler.get_results()
-
-                # Ensure we have all internal URLs
-                for url in crawl_results.internal:
-                    if url not in internal_urls:
-                        internal_urls.append(url)
-
-                # Ensure we have all external URLs and domains
-                for url in crawl_results.external:
-                    if url not in external_urls:
-                        external_urls.append(url)
-                        domain = self.extract_domain(url)
-                        if domain:
-                            external_domains.add(domain)
-
-                website_result = {
-                    "website": str(website.url),
-                    "main_domain": main_domain,
-                    "internal_urls": internal_urls,
-                    "external_urls": external_urls,
-                    "external_domains": list(external_domains),
-                }
-
-                # Log results
-                Logger.info(
-                    self.sketch_id,
-                    {
-                        "message": f"Spread crawl completed for {str(website.url)}: "
-                        f"Main domain: {main_domain}, "
-                        f"{len(internal_urls)} internal URLs, "
-                        f"{len(external_urls)} external URLs, "
-                        f"{len(external_domains)} external domains found."
-                    },
-                )
+            # Create crawler with custom callback
+            crawler = Crawler(
+                url=url_str,
+                recursive=True,
+                same_domain_only=False,
+                verbose=False,  # Disable default verbose output
+                _on_result_callback=url_handler,  # Use our custom handler
+            )
 
-                results.append(website_result)
+            # Perform the crawl off the event loop so other websites can
+            # be crawled concurrently
+            await asyncio.to_thread(crawler.fetch)
+            await asyncio.to_thread(crawler.extract_urls)
+            await asyncio.to_thread(self._flush)
 
-            except Exception as e:
-                # Log error but continue with other websites
-                Logger.error(
-                    self.sketch_id,
-                    {"message": f"Error crawling {str(website.url)}: {str(e)}"},
-                )
+            # Get final results (backup in case callback missed anything)
+            crawl_results = crawler.get_results()
+
+            # Ensure we have all internal URLs
+            internal_urls.update(crawl_results.internal)
+
+            # Ensure we have all external URLs and domains
+            for url in set(crawl_results.external) - external_urls:
+                domain = self.extract_domain(url)
+                if domain:
+                    external_domains.add(domain)
+            external_urls.update(crawl_results.external)
+
+            website_result = {
+                "website": url_str,
+                "main_domain": main_domain,
+                "internal_urls": list(internal_urls),
+                "external_urls": list(external_urls),
+                "external_domains": list(external_domains),
+            }
 
-                # Still create main website and domain nodes even on error
-                main_domain = self.extract_domain(str(website.url))
-                if self.neo4j_conn:
-                    self.create_node(
-                        "website",
-                        "url",
-                        str(website.url),
-                        caption=str(website.url),
-                        type="website",
+            # Log results
+            Logger.info(
+                self.sketch_id,
+                {
+                    "message": f"Spread crawl completed for {url_str}: "
+                    f"Main domain: {main_domain}, "
+                    f"{len(internal_urls)} internal URLs, "
+                    f"{len(external_urls)} external URLs, "
+                    f"{len(external_domains)} external domains found."
+                },
+            )
+
+            return website_result
+
+        except Exception as e:
+            # Log error, other websites are unaffected
+            Logger.error(
+                self.sketch_id,
+                {"message": f"Error crawling {url_str}: {str(e)}"},
+            )
+
+            # Still create main website and domain nodes even on error. Rows
+            # lost to a failed write were dropped from the seen-sets, so these
+            # are queued again in that case.
+            main_domain = self.extract_domain(url_str)
+            if self.neo4j_conn:
+                self._queue_website(url_str)
+                if main_domain:
+                    self._queue_domain(main_domain)
+                    self._queue_link(url_str, main_domain, "BELONGS_TO_DOMAIN")
+                    self.log_graph_message(
+                        f"Website {url_str} belongs to domain {main_domain}"
                     )
-                    if main_domain:
-                        self.create_node(
-                            "domain",
-                            "name",
-                            main_domain,
-                            caption=main_domain,
-                            type="domain",
-                        )
-                        self.create_relationship(
-                            "website",
-                            "url",
-                            str(website.url),
-                            "domain",
-                            "name",
-                            main_domain,
-                            "BELONGS_TO_DOMAIN",
-                        )
-                        self.log_graph_message(
-                            f"Website {str(website.url)} belongs to domain {main_domain}"
-                        )
 
-                # Add empty result for failed website
-                results.append(
-                    {
-                        "website": str(website.url),
-                        "main_domain": main_domain,
-                        "internal_urls": [],
-                        "external_urls": [],
-                        "external_domains": [],
-                    }
-                )
-                continue
+            # Add empty result for failed website
+            return {
+                "website": url_str,
+                "main_domain": main_domain,
+                "internal_urls": [],
+                "external_urls": [],
+                "external_domains": [],
+            }
 
-        return results
+    async def scan(self, data: InputType) -> OutputType:
+        """Crawl websites using reconspread to extract internal and external links."""
+        semaphore = asyncio.Semaphore(self.MAX_WORKERS)
+
+        async def bounded(website: Website) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    return await self._process_one(website)
+                finally:
+                    await asyncio.to_thread(self._flush_logs)
+
+        self._write_error = None
+        self._writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="links-writer"
+        )
+        try:
+            results = await asyncio.gather(*(bounded(website) for website in data))
+            await asyncio.to_thread(self._flush)
+        finally:
+            writer, self._writer = self._writer, None
+            await asyncio.to_thread(writer.shutdown)
+        if self._write_error is not None:
+            error, self._write_error = self._write_error, None
+            raise error
+        return list(results)
 
     def postprocess(self, results: OutputType, original_input: InputType) -> OutputType:
-        # Neo4j nodes and relationships are created in real-time during the callback
+        # Neo4j nodes and relationships are flushed in batches during scan
         # No additional processing needed here
         return results
 
@@ -25,18 +25,7 @@ class WebsiteToText(Transform):
         return "website"
 
     def preprocess(self, data: Union[List[str], List[dict], InputType]) -> InputType:
-        cleaned: InputType = []
-        for item in data:
-            website_obj = None
-            if isinstance(item, str):
-                website_obj = Website(url=item)
-            elif isinstance(item, dict) and "url" in item:
-                website_obj = Website(url=item["url"])
-            elif isinstance(item, Website):
-                website_obj = item
-            if website_obj:
-                cleaned.append(website_obj)
-        return cleaned
+        return self._coerce_websites(data)
 
     async def scan(self, data: InputType) -> OutputType:
         results: OutputType = []
@@ -1,3 +1,5 @@
+import asyncio
+from collections import defaultdict
 from typing import List, Dict, Any, Union, Optional
 from spectragraph_core.core.transform_base import Transform
 from spectragraph_types.website import Website
@@ -8,6 +10,22 @@ from spectragraph_core.core.vault import VaultProtocol
 from recontrack import TrackingCodeExtractor
 
 
+# Bulk MERGE of websites, their trackers and the HAS_TRACKER relationships
+_MERGE_TRACKERS = """
+UNWIND $rows AS r
+MERGE (w:website {url: r.website, sketch_id: $sketch_id})
+ON CREATE SET w.created_at = $created_at
+SET w.type = "website", w.label = r.website, w.caption = r.website
+MERGE (t:webtracker {tracker_id: r.tracker_id, sketch_id: $sketch_id})
+ON CREATE SET t.created_at = $created_at
+SET t.type = "webtracker", t.label = r.tracker_id, t.caption = r.name
+MERGE (w)-[:HAS_TRACKER {sketch_id: $sketch_id}]->(t)
+"""
+
+# Node (label, key) pairs _MERGE_TRACKERS merges on
+_MERGE_KEYS = [("website", "url"), ("webtracker", "tracker_id")]
+
+
 class WebsiteToWebtrackersTransform(Transform):
     """From website to webtrackers."""
 
@@ -15,6 +33,11 @@ class WebsiteToWebtrackersTransform(Transform):
     InputType = List[Website]
     OutputType = List[WebTracker]
 
+    # Number of websites fetched concurrently
+    MAX_WORKERS = 8
+    # Number of rows written per UNWIND query
+    BATCH_SIZE = 1000
+
     def __init__(
         self,
         sketch_id: str,
@@ -25,7 +48,7 @@ class WebsiteToWebtrackersTransform(Transform):
         params: Optional[Dict[str, Any]] = None,
     ):
         super().__init__(sketch_id, scan_id, neo4j_conn, params_schema, vault, params)
-        self.tracker_website_mapping: List[tuple[WebTracker, Website]] = []
+        self._trackers_by_url: Dict[str, List[WebTracker]] = defaultdict(list)
 
     @classmethod
     def name(cls) -> str:
@@ -40,90 +63,72 @@ class WebsiteToWebtrackersTransform(Transform):
         return "website"
 
     def preprocess(self, data: Union[List[str], List[dict], InputType]) -> InputType:
-        cleaned: InputType = []
-        for item in data:
-            website_obj = None
-            if isinstance(item, str):
-                website_obj = Website(url=item)
-            elif isinstance(item, dict) and "url" in item:
-                website_obj = Website(url=item["url"])
-            elif isinstance(item, Website):
-                website_obj = item
-            if website_obj:
-                cleaned.append(website_obj)
-        return cleaned
+        return self._coerce_websites(data)
+
+    async def _process_one(self, website: Website) -> List[WebTracker]:
+        """Extract the tracking codes of a single website."""
+        trackers: List[WebTracker] = []
+        url_str = str(website.url)
+        try:
+            # Extract tracking codes from the website, off the event loop
+            extractor = TrackingCodeExtractor(url_str)
+            await asyncio.to_thread(extractor.fetch)
+            extractor.extract_codes()
+            tracking_codes = extractor.get_results()
+
+            for tracker_info in tracking_codes:
+                tracker = WebTracker(
+                    name=tracker_info.source,
+                    tracker_id=tracker_info.code,
+                    website_url=url_str,
+                )
+                trackers.append(tracker)
+                self._trackers_by_url[url_str].append(tracker)
+
+        except Exception as e:
+            Logger.error(
+                self.sketch_id,
+                {"message": f"Error extracting web trackers from {url_str}: {e}"},
+            )
+
+        return trackers
 
     async def scan(self, data: InputType) -> OutputType:
-        results: OutputType = []
+        semaphore = asyncio.Semaphore(self.MAX_WORKERS)
 
-        for website in data:
-            try:
-                # Extract tracking codes from the website
-                extractor = TrackingCodeExtractor(str(website.url))
-                extractor.fetch()
-                extractor.extract_codes()
-                tracking_codes = extractor.get_results()
-
-                for tracker_info in tracking_codes:
-                    tracker = WebTracker(
-                        name=tracker_info.source,
-                        tracker_id=tracker_info.code,
-                        website_url=str(website.url),
-                    )
-                    results.append(tracker)
-                    self.tracker_website_mapping.append((tracker, website))
-
-            except Exception as e:
-                Logger.error(
-                    self.sketch_id,
-                    {
-                        "message": f"Error extracting web trackers from {website.url}: {e}"
-                    },
-                )
-                continue
+        async def bounded(website: Website) -> List[WebTracker]:
+            async with semaphore:
+                return await self._process_one(website)
 
+        per_website = await asyncio.gather(*(bounded(website) for website in data))
+
+        results: OutputType = []
+        for trackers in per_website:
+            results.extend(trackers)
         return results
 
     def postprocess(self, results: OutputType, original_input: InputType) -> OutputType:
         # Create Neo4j relationships between websites and their corresponding trackers
         if self.neo4j_conn:
-            # Group trackers by website using the mapping we created during scan
-            website_trackers = {}
-            for tracker, website in self.tracker_website_mapping:
-                website_url = str(website.url)
-                if website_url not in website_trackers:
-                    website_trackers[website_url] = []
-                website_trackers[website_url].append(tracker)
-
-            # Create nodes and relationships for each website and its trackers
-            for website_url, trackers in website_trackers.items():
-                # Create website node
-                self.create_node(
-                    "website", "url", website_url, caption=website_url, type="website"
+            # Write every website, tracker and relationship with UNWIND
+            rows = [
+                {
+                    "website": website_url,
+                    "tracker_id": tracker.tracker_id,
+                    "name": tracker.name,
+                }
+                for website_url, trackers in self._trackers_by_url.items()
+                for tracker in trackers
+            ]
+            self.bulk_merge(
+                [(_MERGE_TRACKERS, rows)], self.BATCH_SIZE, indexes=_MERGE_KEYS
+            )
+
+            for row in rows:
+                self.log_graph_message(
+                    f"Found tracker {row['name']} ({row['tracker_id']}) for website {row['website']}"
                 )
 
-                # Create tracker nodes and relationships
-                for tracker in trackers:
-                    self.create_node(
-                        "webtracker", 
-                        "tracker_id", 
-                        tracker.tracker_id, 
-                        caption=tracker.name, 
-                        type="webtracker"
-                    )
-                    self.create_relationship(
-                        "website",
-                        "url",
-                        website_url,
-                        "webtracker",
-                        "tracker_id",
-                        tracker.tracker_id,
-                        "HAS_TRACKER",
-                    )
-                    self.log_graph_message(
-                        f"Found tracker {tracker.name} ({tracker.tracker_id}) for website {website_url}"
-                    )
-
         return results
 
 
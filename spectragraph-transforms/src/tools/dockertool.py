@@ -1,18 +1,35 @@
+import threading
+from typing import Iterator, Optional
 from docker import from_env, DockerClient
 from docker.errors import ImageNotFound, APIError, DockerException
 from .base import Tool
 
 
 class DockerTool(Tool):
+    # One daemon connection shared by every tool instance
+    _shared_client: Optional[DockerClient] = None
+    _client_lock = threading.Lock()
+
     def __init__(self, image: str, default_tag: str = "latest"):
         self.image = f"{image}:{default_tag}"
+        # The local image catalogue only changes through install()/update(),
+        # so a positive lookup is remembered for the lifetime of the tool
+        self._image_present = False
         try:
-            self.client = from_env()
+            self._client()
         except Exception as e:
             raise RuntimeError(
                 f"Failed to connect to Docker daemon. Is Docker running? Error: {e}"
             )
 
+    @classmethod
+    def _client(cls) -> DockerClient:
+        if DockerTool._shared_client is None:
+            with DockerTool._client_lock:
+                if DockerTool._shared_client is None:
+                    DockerTool._shared_client = from_env()
+        return DockerTool._shared_client
+
     @classmethod
     def get_image(cls) -> str:
         return cls.image
@@ -20,13 +37,14 @@ class DockerTool(Tool):
     def install(self):
         try:
             print(f"[DockerTool] Pulling image: {self.image}")
-            self.client.images.pull(self.image)
+            self._client().images.pull(self.image)
+            self._image_present = True
         except APIError as e:
             raise RuntimeError(f"Failed to pull image {self.image}: {e.explanation}")
 
     def version(self) -> str:
         try:
-            output = self.client.containers.run(
+            output = self._client().containers.run(
                 self.image,
                 command="--version",
                 remove=True,
@@ -40,67 +58,101 @@ class DockerTool(Tool):
             return f"unknown (error: {str(e)})"
 
     def is_installed(self) -> bool:
+        if self._image_present:
+            return True
         try:
-            self.client.images.get(self.image)
+            self._client().images.get(self.image)
+            self._image_present = True
             return True
         except ImageNotFound:
             return False
 
-    def launch(self, command: str, volumes: dict = None, timeout: int = 30, environment: dict = None):
-        self.install()
+    def _run_detached(
+        self,
+        command: str,
+        volumes: Optional[dict] = None,
+        environment: Optional[dict] = None,
+    ):
+        if not self.is_installed():
+            self.install()
         # Merge default environment with custom environment
         env = {"TERM": "dumb"}  # Set terminal type to avoid TTY issues
         if environment:
             env.update(environment)
+        return self._client().containers.run(
+            self.image,
+            command=command,
+            volumes=volumes or {},
+            detach=True,
+            tty=False,
+            network_mode="bridge",
+            stdin_open=False,  # Ensure stdin is not open
+            environment=env,
+        )
 
-        try:
-            result = self.client.containers.run(
-                self.image,
-                command=command,
-                remove=True,
-                stdout=True,
-                stderr=True,
-                volumes=volumes or {},
-                detach=False,
-                tty=False,
-                network_mode="bridge",
-                stdin_open=False,  # Ensure stdin is not open
-                environment=env,
+    def _check_exit(self, container, command: str) -> None:
+        status = container.wait()
+        exit_code = status.get("StatusCode", 0)
+        if exit_code != 0:
+            stderr = container.logs(stdout=False, stderr=True).decode(errors="replace")
+            raise RuntimeError(
+                f"Docker error while running {self.image}: command {command!r} "
+                f"exited with status {exit_code}: {stderr.strip()}"
             )
-            return result.decode()
+
+    def _docker_error(self, e: DockerException) -> RuntimeError:
+        error_detail = str(e)
+        if hasattr(e, "response") and hasattr(e.response, "json"):
+            try:
+                error_json = e.response.json()
+                error_detail = f"{str(e)} - Details: {error_json}"
+            except:
+                pass
+        return RuntimeError(f"Docker error while running {self.image}: {error_detail}")
+
+    @staticmethod
+    def _remove(container) -> None:
+        if container is not None:
+            try:
+                container.remove(force=True)
+            except DockerException:
+                pass
+
+    def launch(self, command: str, volumes: dict = None, timeout: int = 30, environment: dict = None):
+        container = None
+        try:
+            # Run detached so the exit code and stderr can be read from the
+            # same container instead of running the command a second time
+            container = self._run_detached(command, volumes, environment)
+            self._check_exit(container, command)
+            return container.logs(stdout=True, stderr=True).decode()
         except ImageNotFound:
             raise RuntimeError(f"Image {self.image} not found. Did you run install()?")
         except DockerException as e:
-            # Try to get more detailed error information
-            error_detail = str(e)
-            if hasattr(e, "response") and hasattr(e.response, "json"):
-                try:
-                    error_json = e.response.json()
-                    error_detail = f"{str(e)} - Details: {error_json}"
-                except:
-                    pass
-
-            # Check if it's a container exit error
-            if "returned non-zero exit status" in str(e):
-                # Try to run the command with stderr capture to see what went wrong
-                try:
-                    test_result = self.client.containers.run(
-                        self.image,
-                        command=command,
-                        remove=True,
-                        stdout=True,
-                        stderr=True,
-                        detach=False,
-                        tty=False,
-                        network_mode="bridge",
-                        stdin_open=False,
-                        environment=env,
-                    )
-                    # If we get here, the command actually worked
-                    return test_result.decode()
-                except DockerException as test_e:
-                    error_detail = f"{str(e)} - Test run also failed: {str(test_e)}"
+            raise self._docker_error(e)
+        finally:
+            self._remove(container)
 
-            raise RuntimeError(
-                f"Docker error while running {self.image}: {error_detail}"
-            )
+    def launch_stream(
+        self, command: str, volumes: dict = None, environment: dict = None
+    ) -> Iterator[bytes]:
+        """Yield the container's stdout line by line while it runs."""
+        container = None
+        try:
+            container = self._run_detached(command, volumes, environment)
+            pending = b""
+            for chunk in container.logs(
+                stdout=True, stderr=False, stream=True, follow=True
+            ):
+                pending += chunk
+                *lines, pending = pending.split(b"\n")
+                yield from lines
+            if pending:
+                yield pending
+            self._check_exit(container, command)
+        except ImageNotFound:
+            raise RuntimeError(f"Image {self.image} not found. Did you run install()?")
+        except DockerException as e:
+            raise self._docker_error(e)
+        finally:
+            self._remove(container)
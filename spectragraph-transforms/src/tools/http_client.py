@@ -0,0 +1,37 @@
+import asyncio
+import weakref
+
+import httpx
+
+# Shared by every tool and transform so connections (and their TLS sessions)
+# are reused across services. An httpx.AsyncClient cannot be shared across
+# event loops, and each transform run gets its own loop, hence one per loop.
+_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=32)
+
+
+def async_client() -> httpx.AsyncClient:
+    """Return the pooled async HTTP client of the running event loop.
+
+    The client is shared: do not close it or use it as a context manager.
+    Whoever owns the loop closes it with aclose_clients() before the loop ends.
+    Pass per-request timeouts to the request methods when 10s does not fit.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(timeout=10, limits=_LIMITS)
+        _clients[loop] = client
+    return client
+
+
+async def aclose_clients() -> None:
+    """Close the running event loop's client, if one was created.
+
+    Pooled connections keep a reference to their loop, so a client left open
+    outlives the loop along with its keep-alive sockets.
+    """
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
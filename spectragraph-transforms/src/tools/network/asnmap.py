@@ -1,12 +1,24 @@
+import re
 import json
-from typing import Any, Literal
+from typing import Any, Dict, List, Literal
 from ..dockertool import DockerTool
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+_VERSION_RE = re.compile(r"(v[\d\.]+)")
+
 
 class AsnmapTool(DockerTool):
     image = "projectdiscovery/asnmap"
     default_tag = "latest"
 
+    # Items passed to one asnmap run by launch_many
+    BATCH_SIZE = 500
+
     def __init__(self):
         super().__init__(self.image, self.default_tag)
 
@@ -27,7 +39,7 @@ class AsnmapTool(DockerTool):
 
     def version(self) -> str:
         try:
-            output = self.client.containers.run(
+            output = self._client().containers.run(
                 image=self.image,
                 command="--version",
                 remove=True,
@@ -35,9 +47,7 @@ class AsnmapTool(DockerTool):
                 stdout=True,
             )
             output_str = output.decode()
-            import re
-
-            match = re.search(r"(v[\d\.]+)", output_str)
+            match = _VERSION_RE.search(output_str)
             version = match.group(1) if match else "unknown"
             return version
         except Exception as e:
@@ -50,16 +60,17 @@ class AsnmapTool(DockerTool):
     def is_installed(self) -> bool:
         return super().is_installed()
 
-    def launch(
-        self, item: str, type: Literal["domain", "organization", "ip", "asn"] = "domain", api_key: str = None
-    ) -> Any:
-        flags = {"domain": "-d", "org": "-org", "ip": "-i", "asn": "-a"}
-        if type not in flags:
+    _FLAGS = {"domain": "-d", "org": "-org", "ip": "-i", "asn": "-a"}
+
+    def _flag(self, type: str) -> str:
+        if type not in self._FLAGS:
             raise ValueError(
-                f"Invalid type: '{type}'. Valid types are: {list(flags.keys())}"
+                f"Invalid type: '{type}'. Valid types are: {list(self._FLAGS.keys())}"
             )
-        flag = flags[type]
+        return self._FLAGS[type]
 
+    def _run(self, target: str, flag: str, api_key: str = None) -> list[Dict[str, Any]]:
+        """Run asnmap and parse its newline-delimited JSON records."""
         # Prepare environment variables
         env = {}
         if api_key:
@@ -67,46 +78,81 @@ class AsnmapTool(DockerTool):
 
         try:
             # Use the -target argument as asnmap expects
-            result = super().launch(f"{flag} {item} -silent -json", environment=env)
-            if result and result != "":
-                # asnmap returns newline-delimited JSON (one JSON object per line)
-                lines = result.strip().split('\n')
-
-                if len(lines) == 1:
-                    # Single JSON object
-                    return json.loads(lines[0])
-                else:
-                    # Multiple JSON objects - combine them
-                    combined_data = {
-                        "as_range": [],
-                        "as_name": None,
-                        "as_country": None,
-                        "as_number": None,
-                    }
-
-                    for line in lines:
-                        if not line.strip():
-                            continue
-                        try:
-                            data = json.loads(line)
-                            if "as_range" in data:
-                                combined_data["as_range"].extend(data["as_range"])
-                            if data.get("as_name") and not combined_data["as_name"]:
-                                combined_data["as_name"] = data["as_name"]
-                            if data.get("as_country") and not combined_data["as_country"]:
-                                combined_data["as_country"] = data["as_country"]
-                            if data.get("as_number") and not combined_data["as_number"]:
-                                combined_data["as_number"] = data["as_number"]
-                        except json.JSONDecodeError:
-                            continue
-
-                    return combined_data if combined_data["as_range"] or combined_data["as_number"] else {}
-            else:
-                return {}
-        except json.JSONDecodeError as e:
-            raise RuntimeError(f"Failed to parse JSON output from asnmap: {str(e)}")
+            result = super().launch(f"{flag} {target} -silent -json", environment=env)
         except Exception as e:
             # Try to get more info from the container logs
             raise RuntimeError(
                 f"Error running asnmap: {str(e)}. Output: {getattr(e, 'output', 'No output')}"
             )
+        if not result:
+            return []
+        lines = [line for line in result.strip().split("\n") if line.strip()]
+        if len(lines) == 1:
+            try:
+                return [_json_loads(lines[0])]
+            except ValueError as e:
+                raise RuntimeError(f"Failed to parse JSON output from asnmap: {str(e)}")
+        records = []
+        for line in lines:
+            try:
+                records.append(_json_loads(line))
+            except ValueError:
+                continue
+        return records
+
+    @staticmethod
+    def _merge(records: list[Dict[str, Any]]) -> Dict[str, Any]:
+        """Fold the records returned for one input into a single result."""
+        if not records:
+            return {}
+        if len(records) == 1:
+            return records[0]
+        combined_data = {
+            "as_range": [],
+            "as_name": None,
+            "as_country": None,
+            "as_number": None,
+        }
+        for data in records:
+            if "as_range" in data:
+                combined_data["as_range"].extend(data["as_range"])
+            if data.get("as_name") and not combined_data["as_name"]:
+                combined_data["as_name"] = data["as_name"]
+            if data.get("as_country") and not combined_data["as_country"]:
+                combined_data["as_country"] = data["as_country"]
+            if data.get("as_number") and not combined_data["as_number"]:
+                combined_data["as_number"] = data["as_number"]
+        return (
+            combined_data
+            if combined_data["as_range"] or combined_data["as_number"]
+            else {}
+        )
+
+    def launch(
+        self, item: str, type: Literal["domain", "organization", "ip", "asn"] = "domain", api_key: str = None
+    ) -> Any:
+        flag = self._flag(type)
+        return self._merge(self._run(item, flag, api_key))
+
+    def launch_many(
+        self,
+        items: List[str],
+        type: Literal["domain", "organization", "ip", "asn"] = "domain",
+        api_key: str = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Look up several items in a single asnmap run per BATCH_SIZE items.
+
+        Returns the merged result of each item, keyed by item. Items asnmap
+        reports nothing for are absent from the mapping.
+        """
+        flag = self._flag(type)
+        results: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(items), self.BATCH_SIZE):
+            batch = items[start : start + self.BATCH_SIZE]
+            by_input: Dict[str, list[Dict[str, Any]]] = {}
+            for record in self._run(",".join(batch), flag, api_key):
+                by_input.setdefault(record.get("input"), []).append(record)
+            for item, records in by_input.items():
+                if item is not None:
+                    results[item] = self._merge(records)
+        return results
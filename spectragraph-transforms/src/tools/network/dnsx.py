@@ -1,8 +1,12 @@
+import re
 import json
 from typing import Any, List
 from ..dockertool import DockerTool
 
 
+_VERSION_RE = re.compile(r"(v[\d\.]+)")
+
+
 class DnsxTool(DockerTool):
     image = "projectdiscovery/dnsx"
     default_tag = "latest"
@@ -27,7 +31,7 @@ class DnsxTool(DockerTool):
 
     def version(self) -> str:
         try:
-            output = self.client.containers.run(
+            output = self._client().containers.run(
                 image=self.image,
                 command="--version",
                 remove=True,
@@ -35,9 +39,7 @@ class DnsxTool(DockerTool):
                 stdout=True,
             )
             output_str = output.decode()
-            import re
-
-            match = re.search(r"(v[\d\.]+)", output_str)
+            match = _VERSION_RE.search(output_str)
             version = match.group(1) if match else "unknown"
             return version
         except Exception as e:
@@ -1,7 +1,15 @@
+import re
 import json
 from typing import Any, List
 from ..dockertool import DockerTool
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+_VERSION_RE = re.compile(r"(v[\d\.]+)")
+
 
 class HttpxTool(DockerTool):
     image = "projectdiscovery/httpx"
@@ -27,7 +35,7 @@ class HttpxTool(DockerTool):
 
     def version(self) -> str:
         try:
-            output = self.client.containers.run(
+            output = self._client().containers.run(
                 image=self.image,
                 command="--version",
                 remove=True,
@@ -35,9 +43,7 @@ class HttpxTool(DockerTool):
                 stdout=True,
             )
             output_str = output.decode()
-            import re
-
-            match = re.search(r"(v[\d\.]+)", output_str)
+            match = _VERSION_RE.search(output_str)
             version = match.group(1) if match else "unknown"
             return version
         except Exception as e:
@@ -55,21 +61,10 @@ class HttpxTool(DockerTool):
             args = []
         args_str = " ".join(args) if args else ""
         command = f"-u {target} {args_str} -json -silent"
-        result = super().launch(command)
 
-        # Handle empty result
-        if not result or result.strip() == "":
-            return []
-
-        # Handle multiple JSON lines (one per result)
-        lines = result.strip().split("\n")
+        # Parse results as httpx emits them, one JSON object per line
         results = []
-
-        for line in lines:
-            line = line.strip()
-            if line:
-                try:
-                    results.append(json.loads(line))
-                except json.JSONDecodeError as e:
-                    raise e
+        for line in self.launch_stream(command):
+            if line.strip():
+                results.append(_json_loads(line))
         return results
@@ -1,7 +1,11 @@
-from typing import List
+import re
+from typing import Iterator, List
 from ..dockertool import DockerTool
 
 
+_VERSION_RE = re.compile(r"(v[\d\.]+)")
+
+
 class MapcidrTool(DockerTool):
     image = "projectdiscovery/mapcidr"
     default_tag = "latest"
@@ -26,7 +30,7 @@ class MapcidrTool(DockerTool):
 
     def version(self) -> str:
         try:
-            output = self.client.containers.run(
+            output = self._client().containers.run(
                 image=self.image,
                 command="--version",
                 remove=True,
@@ -34,9 +38,7 @@ class MapcidrTool(DockerTool):
                 stdout=True,
             )
             output_str = output.decode()
-            import re
-
-            match = re.search(r"(v[\d\.]+)", output_str)
+            match = _VERSION_RE.search(output_str)
             version = match.group(1) if match else "unknown"
             return version
         except Exception as e:
@@ -74,6 +76,32 @@ class MapcidrTool(DockerTool):
         Returns:
             List of IP addresses
         """
+        return list(
+            self.launch_iter(
+                cidr,
+                slice_by=slice_by,
+                aggregate=aggregate,
+                shuffle_ips=shuffle_ips,
+                shuffle_ports=shuffle_ports,
+                count=count,
+                api_key=api_key,
+            )
+        )
+
+    def launch_iter(
+        self,
+        cidr: str,
+        slice_by: int = None,
+        aggregate: bool = False,
+        shuffle_ips: bool = False,
+        shuffle_ports: bool = False,
+        count: bool = False,
+        api_key: str = None,
+    ) -> Iterator[str]:
+        """Same as launch, yielding each line while mapcidr writes it.
+
+        The whole output of a large range is never held in memory at once.
+        """
         # Build command
         flags = ["-silent"]
 
@@ -96,13 +124,11 @@ class MapcidrTool(DockerTool):
             env["PDCP_API_KEY"] = api_key
 
         try:
-            result = super().launch(command, environment=env)
-            if result and result.strip():
-                # Split by newlines and filter out empty lines
-                ips = [line.strip() for line in result.split("\n") if line.strip()]
-                return ips
-            else:
-                return []
+            for line in self.launch_stream(command, environment=env):
+                # Skip empty lines
+                line = line.strip()
+                if line:
+                    yield line.decode(errors="replace")
         except Exception as e:
             raise RuntimeError(
                 f"Error running mapcidr: {str(e)}. Output: {getattr(e, 'output', 'No output')}"
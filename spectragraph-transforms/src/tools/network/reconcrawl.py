@@ -2,6 +2,21 @@ from typing import Any, Dict
 
 from ..base import Tool
 
+try:
+    from reconcrawl import Crawler as _Crawler
+except ImportError:
+    _Crawler = None
+
+# Crawler options used when the caller does not set them
+_DEFAULTS: Dict[str, Any] = {
+    "max_pages": 500,
+    "timeout": 30,
+    "delay": 1.0,
+    "verbose": False,
+    "recursive": True,
+    "verify_ssl": False,  # Default to False for compatibility
+}
+
 
 class ReconCrawlTool(Tool):
 
@@ -27,27 +42,15 @@ class ReconCrawlTool(Tool):
         pass
 
     def is_installed(self) -> bool:
-        try:
-            import reconcrawl
-
-            return True
-        except ImportError:
-            return False
+        return _Crawler is not None
 
     def launch(self, url: str, args: Dict[str, Any] = None) -> Any:
-        from reconcrawl import Crawler
-
-        crawler = Crawler(
-            url=str(url),
-            max_pages=args.get("max_pages", 500),
-            timeout=args.get("timeout", 30),
-            delay=args.get("delay", 1.0),
-            verbose=args.get("verbose", False),
-            recursive=args.get("recursive", True),
-            verify_ssl=args.get(
-                "verify_ssl", False
-            ),  # Default to False for compatibility
-        )
+        if _Crawler is None:
+            raise RuntimeError("reconcrawl is not installed")
+
+        # Unknown keys in args are ignored, as before
+        options = {**_DEFAULTS, **(args or {})}
+        crawler = _Crawler(url=str(url), **{key: options[key] for key in _DEFAULTS})
         crawler.fetch()
         crawler.extract_emails()
         crawler.extract_phones()
@@ -1,8 +1,12 @@
+import re
 from typing import Any, List
 from ..dockertool import DockerTool
 from spectragraph_core.utils import is_valid_domain
 
 
+_VERSION_RE = re.compile(r"(v[\d\.]+)")
+
+
 class SubfinderTool(DockerTool):
     image = "projectdiscovery/subfinder"
     default_tag = "latest"
@@ -28,7 +32,7 @@ class SubfinderTool(DockerTool):
     def version(self) -> str:
         try:
             # subfinder requires input even when checking version, so we provide a dummy domain
-            output = self.client.containers.run(
+            output = self._client().containers.run(
                 image=self.image,
                 command="--version",
                 remove=True,
@@ -36,9 +40,7 @@ class SubfinderTool(DockerTool):
                 stdout=True,
             )
             output_str = output.decode()
-            import re
-
-            match = re.search(r"(v[\d\.]+)", output_str)
+            match = _VERSION_RE.search(output_str)
             version = match.group(1) if match else "unknown"
             return version
         except Exception as e:
@@ -56,8 +58,8 @@ class SubfinderTool(DockerTool):
         if args is None:
             args = []
         command = f"-d {domain} {' '.join(args)}"
-        result = super().launch(command)
-        for sub in result.split("\n"):
+        for line in self.launch_stream(command):
+            sub = line.decode(errors="replace").strip()
             if (
                 is_valid_domain(sub)
                 and sub.endswith(domain)
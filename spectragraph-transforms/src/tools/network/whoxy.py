@@ -1,8 +1,13 @@
 from typing import Dict
 
 import requests
+from requests.adapters import HTTPAdapter
 from ..base import Tool
 
+# Keep-alive connections to the API, shared by every WhoxyTool
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=64))
+
 
 class WhoxyTool(Tool):
 
@@ -26,7 +31,7 @@ class WhoxyTool(Tool):
 
     def launch(self, params: Dict[str, str] = {}) -> list[Dict]:
         try:
-            resp = requests.get(
+            resp = _SESSION.get(
                 self.whoxy_api_endoint,
                 params=params,
                 timeout=10,
@@ -1,11 +1,81 @@
-from typing import Dict
+import asyncio
+import json
+import random
+import time
+from typing import Any, Dict, List, Union
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 from ..base import Tool
+from ..cache import TTLCache
+from ..http_client import async_client
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+SEARCH_URL = "https://recherche-entreprises.api.gouv.fr/search"
+
+# Statuses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Keep-alive connections to the API, shared by every SireneTool
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=64))
+
+# The business registry changes slowly, so results are reused for an hour
+_CACHE = TTLCache(maxsize=4096, ttl=3600)
+
+
+def _cache_key(query: str, limit: int) -> tuple[str, int]:
+    return (query.strip().lower(), limit)
+
+
+class TokenBucket:
+    """Async token bucket allowing `rate` requests per second, `burst` at once."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+
+    async def acquire(self) -> None:
+        while True:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.last_refill) * self.rate
+            )
+            self.last_refill = now
+            # No await between the check and the decrement, so concurrent
+            # coroutines cannot both take the last token
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+# One bucket per API host, so a slow host does not throttle the others
+_buckets: Dict[str, TokenBucket] = {}
+
+
+def _bucket_for(url: str, rate: float = 7, burst: int = 14) -> TokenBucket:
+    host = urlparse(url).netloc
+    if host not in _buckets:
+        _buckets[host] = TokenBucket(rate, burst)
+    return _buckets[host]
 
 
 class SireneTool(Tool):
 
+    # Retries of a query answered with one of RETRY_STATUSES
+    MAX_RETRIES = 3
+    # Exponential backoff between retries, in seconds
+    BACKOFF_BASE = 1.0
+    BACKOFF_CAP = 30.0
+
     @classmethod
     def name(cls) -> str:
         return "sirene"
@@ -22,22 +92,95 @@ class SireneTool(Tool):
     def category(cls) -> str:
         return "Business intelligence"
 
-    def launch(self, query: str, limit: int = 25) -> list[Dict]:
+    @staticmethod
+    def _results(query: str, data: Dict[str, Any]) -> list[Dict]:
+        results = data.get("results") or []
+        if not results:
+            raise ValueError(f"No match found for {query}.")
+        return results
+
+    def _retry_delay(self, attempt: int, retry_after: str | None) -> float:
+        """Seconds to wait before retry number attempt (starting at 0)."""
+        if retry_after is not None:
+            try:
+                return min(self.BACKOFF_CAP, float(retry_after))
+            except ValueError:
+                pass
+        # Jitter keeps concurrent lookups from retrying in lockstep
+        delay = min(self.BACKOFF_CAP, self.BACKOFF_BASE * 2**attempt)
+        return delay * random.uniform(0.5, 1.0)
+
+    def launch(self, query: str, limit: int = 25, use_cache: bool = True) -> list[Dict]:
         # Query can be multiple types of entries: full names ("<first> + <last>"), name, geolocation, etc.
+        cache_key = _cache_key(query, limit)
+        if use_cache and (cached := _CACHE.get(cache_key)) is not None:
+            return list(cached)
         try:
-            query = query.replace(" ", "+")
             params = {"q": query, "per_page": limit}
-            resp = requests.get(
-                "https://recherche-entreprises.api.gouv.fr/search",
-                params=params,
-                timeout=10,
+            for attempt in range(self.MAX_RETRIES + 1):
+                resp = _SESSION.get(SEARCH_URL, params=params, timeout=10)
+                if (
+                    resp.status_code not in RETRY_STATUSES
+                    or attempt == self.MAX_RETRIES
+                ):
+                    break
+                time.sleep(self._retry_delay(attempt, resp.headers.get("Retry-After")))
+            resp.raise_for_status()
+            results = self._results(query, _json_loads(resp.content))
+            _CACHE.set(cache_key, results)
+            return list(results)
+        except Exception as e:
+            raise RuntimeError(
+                f"Error querying Sirene API: {str(e)}. Output: {getattr(e, 'output', 'No output')}"
             )
+
+    async def launch_async(
+        self, query: str, limit: int = 25, use_cache: bool = True
+    ) -> list[Dict]:
+        """Same as launch, without blocking the event loop."""
+        cache_key = _cache_key(query, limit)
+        if use_cache and (cached := _CACHE.get(cache_key)) is not None:
+            return list(cached)
+        try:
+            params = {"q": query, "per_page": limit}
+            for attempt in range(self.MAX_RETRIES + 1):
+                # Stay under the API's published limit of 7 requests/second
+                await _bucket_for(SEARCH_URL).acquire()
+                resp = await async_client().get(SEARCH_URL, params=params)
+                if (
+                    resp.status_code not in RETRY_STATUSES
+                    or attempt == self.MAX_RETRIES
+                ):
+                    break
+                await asyncio.sleep(
+                    self._retry_delay(attempt, resp.headers.get("Retry-After"))
+                )
             resp.raise_for_status()
-            data = resp.json()
-            if len(data.get("results")) == 0:
-                raise ValueError(f"No match found for {query}.")
-            return data["results"]
+            results = self._results(query, _json_loads(resp.content))
+            _CACHE.set(cache_key, results)
+            return list(results)
         except Exception as e:
             raise RuntimeError(
                 f"Error querying Sirene API: {str(e)}. Output: {getattr(e, 'output', 'No output')}"
             )
+
+    async def launch_many(
+        self,
+        queries: List[str],
+        limit: int = 25,
+        concurrency: int = 16,
+        use_cache: bool = True,
+    ) -> List[Union[list[Dict], Exception]]:
+        """Run several queries concurrently, in the order they were given.
+
+        A failed query yields its exception instead of failing the batch.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(query: str) -> list[Dict]:
+            async with semaphore:
+                return await self.launch_async(query, limit, use_cache)
+
+        return await asyncio.gather(
+            *(one(query) for query in queries), return_exceptions=True
+        )
@@ -10,3 +10,27 @@ def mock_logger(monkeypatch):
     monkeypatch.setattr(
         "spectragraph_core.core.logger.emit_event_task.delay", lambda *args, **kwargs: None
     )
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-network",
+        action="store_true",
+        default=False,
+        help="run tests that pull images or call external services",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "network: test needs Docker or network access (see --run-network)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-network"):
+        return
+    skip_network = pytest.mark.skip(reason="needs --run-network")
+    for item in items:
+        if item.get_closest_marker("network"):
+            item.add_marker(skip_network)
@@ -57,3 +57,8 @@ class TestLogger:
         """Log a success message"""
         formatted_message = TestLogger._format_message("SUCCESS", message)
         print(formatted_message)
+
+    @staticmethod
+    def _create_logs(sketch_id: Union[str, UUID], entries: list) -> list:
+        """Return dummy log ids for testing"""
+        return ["dummy_id" for _ in entries]
@@ -0,0 +1,64 @@
+import asyncio
+import gc
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from tools import http_client
+from tools.http_client import aclose_clients, async_client
+
+
+class OkHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), OkHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+def open_fds():
+    return len(os.listdir("/proc/self/fd"))
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc")
+def test_aclose_clients_releases_each_loop_client(server_url):
+    clients = []
+
+    async def run():
+        try:
+            client = async_client()
+            clients.append(client)
+            resp = await client.get(server_url)
+            assert resp.status_code == 200
+        finally:
+            await aclose_clients()
+
+    # Warm up imports and the server thread before counting descriptors
+    asyncio.run(run())
+    gc.collect()
+    baseline = open_fds()
+
+    for _ in range(20):
+        asyncio.run(run())
+    gc.collect()
+
+    assert all(client.is_closed for client in clients)
+    assert len(http_client._clients) == 0
+    # The server side may still be closing its end of the last connection
+    assert open_fds() <= baseline + 2
@@ -1,52 +1,99 @@
+import pytest
 import re
 from typing import Dict
 from tools.network.asnmap import AsnmapTool
 
-tool = AsnmapTool()
 
+@pytest.fixture(scope="module")
+def tool():
+    return AsnmapTool()
 
-def test_name():
+
+def test_name(tool):
     assert tool.name() == "asnmap"
 
 
-def test_description():
+def test_description(tool):
     assert tool.description() == "ASN mapping and network reconnaissance tool."
 
 
-def test_category():
+def test_category(tool):
     assert tool.category() == "ASN discovery"
 
 
-def test_image():
+def test_image(tool):
     assert tool.get_image() == "projectdiscovery/asnmap"
 
 
-def test_install():
+@pytest.mark.network
+def test_install(tool):
     tool.install()
     assert tool.is_installed() == True
 
 
-def test_version():
+@pytest.mark.network
+def test_version(tool):
     tool.install()
     version = tool.version()
     # Check that version follows the expected format: v followed by digits and dots
     assert re.match(r"^v[\d\.]+$", version)
 
 
-def test_launch_no_api_key():
+@pytest.mark.network
+def test_launch_no_api_key(tool):
     import pytest
 
     with pytest.raises(KeyError, match="Missing key"):
         tool.launch("alliage.io", "domain")
 
 
-def test_launch_wrong_type():
+def test_launch_wrong_type(tool):
     import pytest
 
     with pytest.raises(ValueError, match="Invalid type: 'domains'"):
         tool.launch("alliage.io", "domains")
 
 
-def test_launch():
+@pytest.mark.network
+def test_launch(tool):
     results = tool.launch("alliage.io", "domain")
     assert isinstance(results, Dict)
+
+
+def test_launch_many_runs_one_container_per_batch(monkeypatch):
+    import json
+    from tools.dockertool import DockerTool
+
+    commands = []
+
+    def fake_launch(self, command, environment=None):
+        commands.append(command)
+        return "\n".join(
+            json.dumps(record)
+            for record in [
+                {
+                    "input": "8.8.8.8",
+                    "as_number": "AS15169",
+                    "as_range": ["8.8.8.0/24"],
+                },
+                {
+                    "input": "8.8.8.8",
+                    "as_number": "AS15169",
+                    "as_range": ["8.8.4.0/24"],
+                },
+                {
+                    "input": "1.1.1.1",
+                    "as_number": "AS13335",
+                    "as_range": ["1.1.1.0/24"],
+                },
+            ]
+        )
+
+    monkeypatch.setattr(DockerTool, "__init__", lambda self, *args: None)
+    monkeypatch.setattr(DockerTool, "launch", fake_launch)
+    results = AsnmapTool().launch_many(["8.8.8.8", "1.1.1.1", "9.9.9.9"], "ip")
+
+    assert commands == ["-i 8.8.8.8,1.1.1.1,9.9.9.9 -silent -json"]
+    assert results["8.8.8.8"]["as_range"] == ["8.8.8.0/24", "8.8.4.0/24"]
+    assert results["1.1.1.1"]["as_number"] == "AS13335"
+    assert "9.9.9.9" not in results
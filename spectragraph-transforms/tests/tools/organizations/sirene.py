@@ -1,37 +1,151 @@
+import asyncio
+import time
+import httpx
+import pytest
 from typing import Dict
-from tools.organizations.sirene import SireneTool
+from tools.organizations import sirene
+from tools.organizations.sirene import SireneTool, TokenBucket
 
-tool = SireneTool()
 
+@pytest.fixture(scope="module")
+def tool():
+    return SireneTool()
 
-def test_name():
+
+@pytest.fixture
+def mock_api(monkeypatch):
+    """Route the tool's HTTP client to a handler(request) -> httpx.Response."""
+
+    def install(handler):
+        monkeypatch.setattr(
+            sirene,
+            "async_client",
+            lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+
+    return install
+
+
+def test_name(tool):
     assert tool.name() == "sirene"
 
 
-def test_description():
+def test_description(tool):
     assert (
         tool.description()
         == "The Sirene API allows you to query the Sirene directory of businesses and establishments, managed by Insee."
     )
 
 
-def test_category():
+def test_category(tool):
     assert tool.category() == "Business intelligence"
 
 
-def test_launch_org():
+@pytest.mark.network
+def test_launch_org(tool):
     results = tool.launch("blablacar", 1)
     assert isinstance(results, list)
     assert all(isinstance(item, Dict) for item in results)
 
 
-def test_launch_person():
+@pytest.mark.network
+def test_launch_person(tool):
     results = tool.launch("Karim+Terrache", 1)
     assert isinstance(results, list)
     assert all(isinstance(item, Dict) for item in results)
 
 
-def test_launch_person_space_format():
+@pytest.mark.network
+def test_launch_person_space_format(tool):
     results = tool.launch("Karim Terrache", 1)
     assert isinstance(results, list)
     assert all(isinstance(item, Dict) for item in results)
+
+
+def test_launch_many_keeps_order_and_isolates_failures(tool, mock_api):
+
+    def handler(request):
+        query = request.url.params["q"]
+        if query == "broken":
+            return httpx.Response(400)
+        return httpx.Response(200, json={"results": [{"q": query}]})
+
+    mock_api(handler)
+    results = asyncio.run(
+        tool.launch_many(["first", "broken", "last"], 1, use_cache=False)
+    )
+    assert results[0] == [{"q": "first"}]
+    assert isinstance(results[1], RuntimeError)
+    assert results[2] == [{"q": "last"}]
+
+
+def test_launch_async_retries_rate_limited_queries(tool, mock_api, monkeypatch):
+
+    responses = [
+        httpx.Response(429, headers={"Retry-After": "2"}),
+        httpx.Response(503),
+        httpx.Response(200, json={"results": [{"siren": "123"}]}),
+    ]
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    mock_api(lambda request: responses.pop(0))
+    monkeypatch.setattr(sirene.asyncio, "sleep", fake_sleep)
+    results = asyncio.run(tool.launch_async("blablacar", 1, use_cache=False))
+    assert results == [{"siren": "123"}]
+    # Retry-After is honored, then exponential backoff with jitter
+    assert delays[0] == 2.0
+    assert 1.0 <= delays[1] <= 2.0
+
+
+def test_token_bucket_limits_rate():
+
+    async def acquire_all(bucket, count):
+        for _ in range(count):
+            await bucket.acquire()
+
+    bucket = TokenBucket(rate=20, burst=2)
+    start = time.monotonic()
+    asyncio.run(acquire_all(bucket, 4))
+    # Two tokens are available at once, the other two take 1/20s each
+    assert time.monotonic() - start >= 0.09
+
+
+def test_launch_async_caches_results(tool, mock_api):
+
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(200, json={"results": [{"siren": "456"}]})
+
+    mock_api(handler)
+    first = asyncio.run(tool.launch_async("Cached Company", 3))
+    # Same query modulo case and surrounding spaces
+    second = asyncio.run(tool.launch_async("  cached company ", 3))
+    assert first == second == [{"siren": "456"}]
+    assert len(calls) == 1
+
+
+def test_launch_async_encodes_spaces_once(tool, mock_api):
+
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(200, json={"results": [{"siren": "789"}]})
+
+    mock_api(handler)
+    asyncio.run(tool.launch_async("Jean Dupont", 1, use_cache=False))
+    (request,) = requests_seen
+    assert request.url.params["q"] == "Jean Dupont"
+    assert b"%2B" not in request.url.query
+
+
+def test_launch_async_reports_missing_results(tool, mock_api):
+
+    mock_api(lambda request: httpx.Response(200, json={}))
+    with pytest.raises(RuntimeError, match="No match found for nobody"):
+        asyncio.run(tool.launch_async("nobody", 1, use_cache=False))
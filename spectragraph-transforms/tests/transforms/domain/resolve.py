@@ -4,10 +4,13 @@ from spectragraph_types.ip import Ip
 from typing import List
 import pytest
 
-transform = ResolveTransform("sketch_123", "scan_123")
 
+@pytest.fixture(scope="module")
+def transform():
+    return ResolveTransform("sketch_123", "scan_123")
 
-def test_preprocess_valid_domains():
+
+def test_preprocess_valid_domains(transform):
     domains = [
         Domain(domain="example.com"),
         Domain(domain="example2.com"),
@@ -20,7 +23,7 @@ def test_preprocess_valid_domains():
     assert result_domains == expected_domains
 
 
-def test_unprocessed_valid_domains():
+def test_unprocessed_valid_domains(transform):
     domains = [
         "example.com",
         "example2.com",
@@ -31,7 +34,7 @@ def test_unprocessed_valid_domains():
     assert result_domains == expected_domains
 
 
-def test_preprocess_invalid_domains():
+def test_preprocess_invalid_domains(transform):
     domains = [
         Domain(domain="example.com"),
         Domain(domain="invalid_domain"),
@@ -45,7 +48,7 @@ def test_preprocess_invalid_domains():
     assert "invalid_domain" not in result_domains
 
 
-def test_preprocess_multiple_formats():
+def test_preprocess_multiple_formats(transform):
     domains = [
         {"domain": "example.com"},
         {"invalid_key": "example.io"},
@@ -62,7 +65,7 @@ def test_preprocess_multiple_formats():
 
 
 @pytest.mark.asyncio
-async def test_scan_returns_ip(monkeypatch):
+async def test_scan_returns_ip(transform, monkeypatch):
     # on crée une fonction mock qui retourne une IP
     def mock_gethostbyname(domain):
         return "12.23.34.45"
@@ -76,7 +79,7 @@ async def test_scan_returns_ip(monkeypatch):
     assert output[0].address == "12.23.34.45"
 
 
-def test_schemas():
+def test_schemas(transform):
     input_schema = transform.input_schema()
     output_schema = transform.output_schema()
 
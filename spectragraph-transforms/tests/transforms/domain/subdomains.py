@@ -1,10 +1,16 @@
+import json
+import pytest
+import requests
 from spectragraph_transforms.domains.subdomains import SubdomainTransform
 from spectragraph_types.domain import Domain, Domain
 
-transform = SubdomainTransform("sketch_123", "scan_123")
 
+@pytest.fixture(scope="module")
+def transform():
+    return SubdomainTransform("sketch_123", "scan_123")
 
-def test_preprocess_valid_domains():
+
+def test_preprocess_valid_domains(transform):
     domains = [
         Domain(domain="example.com"),
         Domain(domain="example2.com"),
@@ -17,7 +23,7 @@ def test_preprocess_valid_domains():
     assert result_domains == expected_domains
 
 
-def test_unprocessed_valid_domains():
+def test_unprocessed_valid_domains(transform):
     domains = [
         "example.com",
         "example2.com",
@@ -28,7 +34,7 @@ def test_unprocessed_valid_domains():
     assert result_domains == expected_domains
 
 
-def test_preprocess_invalid_domains():
+def test_preprocess_invalid_domains(transform):
     domains = [
         Domain(domain="example.com"),
         Domain(domain="invalid_domain"),
@@ -42,7 +48,7 @@ def test_preprocess_invalid_domains():
     assert "invalid_domain" not in result_domains
 
 
-def test_preprocess_multiple_formats():
+def test_preprocess_multiple_formats(transform):
     domains = [
         {"domain": "example.com"},
         {"invalid_key": "example.io"},
@@ -58,34 +64,33 @@ def test_preprocess_multiple_formats():
     assert "example.io" not in result_domains
 
 
-def test_scan_extracts_subdomains(monkeypatch):
+@pytest.mark.asyncio
+async def test_scan_extracts_subdomains(transform, monkeypatch):
     mock_response = [
         {"name_value": "mail.example.com\nwww.example.com"},
         {"name_value": "api.example.com"},
         {"name_value": "invalid_domain"},  # devrait être ignoré
     ]
-
-    class MockRequestsResponse:
-        def __init__(self, json_data):
-            self._json_data = json_data
-            self.status_code = 200
-
-        def json(self):
-            return self._json_data
-
-        @property
-        def ok(self):
-            return True
-
-    def mock_get(url, timeout):
-        assert "example.com" in url
-        return MockRequestsResponse(mock_response)
-
-    # Patch la requête réseau dans le module transform
-    monkeypatch.setattr("requests.get", mock_get)
+    sent = []
+
+    def mock_send(adapter, request, **kwargs):
+        if "crt.sh" not in request.url:
+            # Docker (subfinder) passe aussi par requests : on le rend indisponible
+            raise requests.ConnectionError(request.url)
+        sent.append(request.url)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(mock_response).encode()
+        response.request = request
+        return response
+
+    # Patch au niveau de l'adaptateur : requests.get comme les Session partagées
+    # passent par là
+    monkeypatch.setattr(requests.adapters.HTTPAdapter, "send", mock_send)
 
     input_data = [Domain(domain="example.com")]
-    domains = transform.execute(input_data)
+    domains = await transform.execute(input_data)
+    assert len(sent) == 1 and "example.com" in sent[0]
     assert isinstance(domains, list)
     for sub in domains:
         print(sub)
@@ -1,10 +1,14 @@
+import pytest
 from spectragraph_transforms.domains.whois import WhoisTransform
 from spectragraph_types.domain import Domain
 
-transform = WhoisTransform("sketch_123", "scan_123")
 
+@pytest.fixture(scope="module")
+def transform():
+    return WhoisTransform("sketch_123", "scan_123")
 
-def test_preprocess_valid_domains():
+
+def test_preprocess_valid_domains(transform):
     domains = [
         Domain(domain="example.com"),
         Domain(domain="example2.com"),
@@ -17,7 +21,7 @@ def test_preprocess_valid_domains():
     assert result_domains == expected_domains
 
 
-def test_unprocessed_valid_domains():
+def test_unprocessed_valid_domains(transform):
     domains = [
         "example.com",
         "example2.com",
@@ -28,7 +32,7 @@ def test_unprocessed_valid_domains():
     assert result_domains == expected_domains
 
 
-def test_preprocess_invalid_domains():
+def test_preprocess_invalid_domains(transform):
     domains = [
         Domain(domain="example.com"),
         Domain(domain="invalid_domain"),
@@ -42,7 +46,7 @@ def test_preprocess_invalid_domains():
     assert "invalid_domain" not in result_domains
 
 
-def test_preprocess_multiple_formats():
+def test_preprocess_multiple_formats(transform):
     domains = [
         {"domain": "example.com"},
         {"invalid_key": "example.io"},
@@ -58,7 +62,7 @@ def test_preprocess_multiple_formats():
     assert "example.io" not in result_domains
 
 
-def test_scan_returns_whois_objects(monkeypatch):
+def test_scan_returns_whois_objects(transform, monkeypatch):
     # Patch `whois.whois` to avoid real network call
     mock_whois = lambda domain: {
         "registrar": "MockRegistrar",
@@ -80,7 +84,7 @@ def test_scan_returns_whois_objects(monkeypatch):
     assert output[0].whois.email.email == "admin@example.com"
 
 
-def test_schemas():
+def test_schemas(transform):
     input_schema = transform.input_schema()
     output_schema = transform.output_schema()
     assert input_schema == {
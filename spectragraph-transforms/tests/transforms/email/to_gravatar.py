@@ -213,6 +213,7 @@ class TestEmailToGravatarTransform:
         transform_with_neo4j = EmailToGravatarTransform(
             "sketch_123", "scan_123", neo4j_conn=mock_neo4j
         )
+        transform_with_neo4j.log_graph_message = Mock()
 
         gravatars = [
             Gravatar(src="https://www.gravatar.com/avatar/hash1", hash="hash1"),
@@ -225,8 +226,17 @@ class TestEmailToGravatarTransform:
 
         result = transform_with_neo4j.postprocess(gravatars, original_input)
 
-        # Verify Neo4j queries were executed
-        assert mock_neo4j.query.call_count == 2
+        # Verify both gravatars were written in a single UNWIND query
+        mock_neo4j.execute_batch.assert_called_once()
+        (queries,) = mock_neo4j.execute_batch.call_args.args
+        assert len(queries) == 1
+        query, params = queries[0]
+        assert "UNWIND $rows" in query
+        assert params["sketch_id"] == "sketch_123"
+        assert [row["email"] for row in params["rows"]] == [
+            "test1@example.com",
+            "test2@example.com",
+        ]
 
         # Check that results are returned unchanged
         assert result == gravatars
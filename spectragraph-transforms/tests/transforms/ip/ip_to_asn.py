@@ -1,6 +1,6 @@
 import json
 from unittest.mock import Mock
-from spectragraph_transforms.ips.ip_to_asn import IpToAsnTransform
+from spectragraph_transforms.ips.ip_to_asn import IpToAsnTransform, _lookup_asns
 from spectragraph_types.ip import Ip
 from spectragraph_types.asn import ASN
 from spectragraph_types.cidr import CIDR
@@ -194,6 +194,28 @@ def test_scan_multiple_ips(monkeypatch):
     assert asns[1].name == "CLOUDFLARE"
 
 
+def test_lookup_asns_caches_hits_only(monkeypatch):
+    calls = []
+    answers = {"203.0.113.7": {"as_number": "AS64500", "as_name": "EXAMPLE"}}
+
+    class FakeAsnmap:
+        def launch_many(self, addresses, type, api_key):
+            calls.append(list(addresses))
+            return {a: answers[a] for a in addresses if a in answers}
+
+    monkeypatch.setitem(_lookup_asns.__globals__, "AsnmapTool", FakeAsnmap)
+
+    first = _lookup_asns(["203.0.113.7", "203.0.113.8"], None)
+    assert first["203.0.113.7"]["as_number"] == "AS64500"
+    assert first["203.0.113.8"] == {}
+
+    # The hit is served from the cache, the miss is asked for again
+    answers["203.0.113.8"] = {"as_number": "AS64501", "as_name": "LATER"}
+    second = _lookup_asns(["203.0.113.7", "203.0.113.8"], None)
+    assert calls == [["203.0.113.7", "203.0.113.8"], ["203.0.113.8"]]
+    assert second["203.0.113.8"]["as_number"] == "AS64501"
+
+
 def test_schemas():
     input_schema = transform.input_schema()
     output_schema = transform.output_schema()
@@ -232,17 +254,20 @@ def test_postprocess_creates_neo4j_relationships(monkeypatch):
 
     result = transform.postprocess(asn_results, input_data)
 
-    # Verify Neo4j query was called
-    mock_neo4j.query.assert_called_once()
+    # Verify a single UNWIND batch was written
+    mock_neo4j.execute_batch.assert_called_once()
+    (queries,) = mock_neo4j.execute_batch.call_args.args
+    assert len(queries) == 1
 
     # Check the query parameters
-    call_args = mock_neo4j.query.call_args
-    params = call_args[0][1]
-    assert params["ip_address"] == "8.8.8.8"
-    assert params["asn_number"] == 15169
-    assert params["asn_name"] == "GOOGLE"
-    assert params["asn_country"] == "US"
+    query, params = queries[0]
+    assert "UNWIND $rows" in query
     assert params["sketch_id"] == "sketch_123"
+    (row,) = params["rows"]
+    assert row["address"] == "8.8.8.8"
+    assert row["number"] == 15169
+    assert row["asn_props"]["name"] == "GOOGLE"
+    assert row["asn_props"]["country"] == "US"
 
     # Should return the same results
     assert result == asn_results
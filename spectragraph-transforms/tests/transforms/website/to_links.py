@@ -1,6 +1,15 @@
+import threading
+import time
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
-from spectragraph_transforms.websites.to_links import WebsiteToLinks
+from spectragraph_transforms.website.to_links import (
+    WebsiteToLinks,
+    _APOC_ITERATE,
+    _MERGE_DOMAINS,
+    _MERGE_LINKS,
+    _MERGE_WEBSITES,
+)
 from spectragraph_types.website import Website
 
 
@@ -11,7 +20,14 @@ class MockCrawlResults:
 
 
 class MockCrawler:
-    def __init__(self, url, recursive=True, verbose=False, _on_result_callback=None):
+    def __init__(
+        self,
+        url,
+        recursive=True,
+        same_domain_only=False,
+        verbose=False,
+        _on_result_callback=None,
+    ):
         self.url = url
         self.callback = _on_result_callback
 
@@ -36,170 +52,245 @@ class MockCrawler:
         )
 
 
+def batched_rows(neo4j_conn):
+    """Collect the rows written through execute_batch, keyed by query."""
+    rows = {}
+    for call in neo4j_conn.execute_batch.call_args_list:
+        for query, params in call.args[0]:
+            rows.setdefault(query, []).extend(params["rows"])
+    return rows
+
+
 @pytest.mark.asyncio
-async def test_website_to_links_real_time_neo4j_creation():
-    """Test that Neo4j nodes are created in real-time during the callback."""
+async def test_website_to_links_batched_neo4j_creation():
+    """Test that Neo4j nodes and relationships are written as UNWIND batches."""
     transform = WebsiteToLinks(sketch_id="test", scan_id="test")
 
     # Mock neo4j connection and methods
     transform.neo4j_conn = Mock()
-    transform.create_node = Mock()
-    transform.create_relationship = Mock()
     transform.log_graph_message = Mock()
 
     # Test input
     websites = [Website(url="https://example.com")]
 
-    with patch("src.transforms.websites.to_links.Crawler", MockCrawler):
+    with patch("spectragraph_transforms.website.to_links.Crawler", MockCrawler):
         results = await transform.scan(websites)
 
-    # Verify main website and domain nodes were created upfront
-    transform.create_node.assert_any_call(
-        "website",
-        "url",
-        "https://example.com",
-        caption="https://example.com",
-        type="website",
-    )
-    transform.create_node.assert_any_call(
-        "domain", "name", "example.com", caption="example.com", type="domain"
-    )
-
-    # Verify main website to domain relationship
-    transform.create_relationship.assert_any_call(
-        "website",
-        "url",
-        "https://example.com",
-        "domain",
-        "name",
-        "example.com",
-        "BELONGS_TO_DOMAIN",
-    )
+    main_url = str(websites[0].url)
+    rows = batched_rows(transform.neo4j_conn)
 
-    # Verify internal website nodes were created in callback
-    transform.create_node.assert_any_call(
-        "website",
-        "url",
-        "https://example.com/page1",
-        caption="https://example.com/page1",
-        type="website",
-    )
-    transform.create_node.assert_any_call(
-        "website",
-        "url",
-        "https://example.com/page2",
-        caption="https://example.com/page2",
-        type="website",
-    )
+    # All crawl writes go through execute_batch, never one query per item
+    transform.neo4j_conn.execute_batch.assert_called()
+    for call in transform.neo4j_conn.execute_batch.call_args_list:
+        for _, params in call.args[0]:
+            assert params["sketch_id"] == "test"
 
-    # Verify internal website relationships
-    transform.create_relationship.assert_any_call(
-        "website",
-        "url",
-        "https://example.com",
-        "website",
-        "url",
+    # Website nodes: main website, internal and external pages
+    website_urls = {r["url"] for r in rows[_MERGE_WEBSITES]}
+    assert {
+        main_url,
         "https://example.com/page1",
-        "LINKS_TO",
-    )
-    transform.create_relationship.assert_any_call(
-        "website",
-        "url",
-        "https://example.com",
-        "website",
-        "url",
         "https://example.com/page2",
-        "LINKS_TO",
-    )
-
-    # Verify external website nodes were created in callback
-    transform.create_node.assert_any_call(
-        "website",
-        "url",
         "https://external.com/page",
-        caption="https://external.com/page",
-        type="website",
-    )
-    transform.create_node.assert_any_call(
-        "website",
-        "url",
         "https://another-external.org/resource",
-        caption="https://another-external.org/resource",
-        type="website",
-    )
+    } <= website_urls
+
+    # Domain nodes: main and external domains
+    domain_names = {r["name"] for r in rows[_MERGE_DOMAINS]}
+    assert {"example.com", "external.com", "another-external.org"} <= domain_names
+
+    def pairs(rel_type):
+        return {(r["source"], r["target"]) for r in rows[_MERGE_LINKS[rel_type]]}
+
+    # LINKS_TO relationships from the main website
+    assert {
+        (main_url, "https://example.com/page1"),
+        (main_url, "https://example.com/page2"),
+        (main_url, "https://external.com/page"),
+        (main_url, "https://another-external.org/resource"),
+    } <= pairs("LINKS_TO")
+
+    # BELONGS_TO_DOMAIN relationships
+    assert {
+        (main_url, "example.com"),
+        ("https://example.com/page1", "example.com"),
+        ("https://external.com/page", "external.com"),
+        ("https://another-external.org/resource", "another-external.org"),
+    } <= pairs("BELONGS_TO_DOMAIN")
+
+    # LINKS_TO_DOMAIN relationships from the main website
+    assert {
+        (main_url, "external.com"),
+        (main_url, "another-external.org"),
+    } <= pairs("LINKS_TO_DOMAIN")
+
+
+class RepeatingCrawler(MockCrawler):
+    def extract_urls(self):
+        # Shared navigation links are yielded once per crawled page
+        for _ in range(3):
+            super().extract_urls()
 
-    # Verify external domain nodes were created in callback
-    transform.create_node.assert_any_call(
-        "domain", "name", "external.com", caption="external.com", type="domain"
-    )
-    transform.create_node.assert_any_call(
-        "domain",
-        "name",
-        "another-external.org",
-        caption="another-external.org",
-        type="domain",
-    )
 
-    # Verify main website to external website relationships
-    transform.create_relationship.assert_any_call(
-        "website",
-        "url",
-        "https://example.com",
-        "website",
-        "url",
-        "https://external.com/page",
-        "LINKS_TO",
-    )
-    transform.create_relationship.assert_any_call(
-        "website",
-        "url",
-        "https://example.com",
-        "website",
-        "url",
-        "https://another-external.org/resource",
-        "LINKS_TO",
-    )
+@pytest.mark.asyncio
+async def test_website_to_links_deduplicates_writes():
+    """Test that URLs yielded repeatedly are only written once per scan."""
+    transform = WebsiteToLinks(sketch_id="test", scan_id="test")
+    transform.neo4j_conn = Mock()
+    transform.log_graph_message = Mock()
 
-    # Verify external website to domain relationships
-    transform.create_relationship.assert_any_call(
-        "website",
-        "url",
-        "https://external.com/page",
-        "domain",
-        "name",
-        "external.com",
-        "BELONGS_TO_DOMAIN",
-    )
-    transform.create_relationship.assert_any_call(
-        "website",
-        "url",
-        "https://another-external.org/resource",
-        "domain",
-        "name",
-        "another-external.org",
-        "BELONGS_TO_DOMAIN",
-    )
+    with patch("spectragraph_transforms.website.to_links.Crawler", RepeatingCrawler):
+        await transform.scan([Website(url="https://example.com")])
 
-    # Verify main website to external domain relationships
-    transform.create_relationship.assert_any_call(
-        "website",
-        "url",
-        "https://example.com",
-        "domain",
-        "name",
-        "external.com",
-        "LINKS_TO_DOMAIN",
-    )
-    transform.create_relationship.assert_any_call(
-        "website",
-        "url",
-        "https://example.com",
-        "domain",
-        "name",
-        "another-external.org",
-        "LINKS_TO_DOMAIN",
+    rows = batched_rows(transform.neo4j_conn)
+    website_urls = [r["url"] for r in rows[_MERGE_WEBSITES]]
+    assert len(website_urls) == len(set(website_urls)) == 5
+    domain_names = [r["name"] for r in rows[_MERGE_DOMAINS]]
+    assert len(domain_names) == len(set(domain_names)) == 3
+    links_to = rows[_MERGE_LINKS["LINKS_TO"]]
+    assert len(links_to) == 4
+
+
+@pytest.mark.asyncio
+async def test_website_to_links_flushes_in_background_during_crawl():
+    """Test that flushes triggered mid-crawl run on the writer thread."""
+    transform = WebsiteToLinks(sketch_id="test", scan_id="test")
+    transform.neo4j_conn = Mock()
+    transform.log_graph_message = Mock()
+    transform.BATCH_SIZE = 1
+
+    writer_threads = set()
+    transform.neo4j_conn.execute_batch.side_effect = lambda queries: (
+        writer_threads.add(threading.current_thread().name)
     )
 
+    with patch("spectragraph_transforms.website.to_links.Crawler", MockCrawler):
+        await transform.scan([Website(url="https://example.com")])
+
+    # Every row still reaches Neo4j, whichever thread wrote it
+    rows = batched_rows(transform.neo4j_conn)
+    assert len(rows[_MERGE_WEBSITES]) == 5
+    assert len(rows[_MERGE_DOMAINS]) == 3
+    assert len(rows[_MERGE_LINKS["LINKS_TO"]]) == 4
+    assert any(name.startswith("links-writer") for name in writer_threads)
+    assert transform._writer is None
+    assert transform._in_flight == []
+
+
+def test_waiting_on_a_write_does_not_hold_the_lock():
+    """Test that a crawler waiting on Neo4j leaves other crawls free to queue."""
+    transform = WebsiteToLinks(sketch_id="test", scan_id="test")
+    transform.neo4j_conn = Mock()
+    transform.BATCH_SIZE = 1
+    transform.MAX_PENDING_WRITES = 1
+
+    started, release = threading.Event(), threading.Event()
+
+    def slow_write(queries):
+        started.set()
+        release.wait(5)
+
+    transform.neo4j_conn.execute_batch.side_effect = slow_write
+    transform._writer = ThreadPoolExecutor(max_workers=1)
+    try:
+        transform._queue_website("https://example.com/0")
+        assert started.wait(5)
+
+        # The writer queue is full, so this crawl waits for the first write
+        waiter = threading.Thread(
+            target=transform._queue_website, args=("https://example.com/1",)
+        )
+        waiter.start()
+        time.sleep(0.2)
+        assert waiter.is_alive()
+
+        # Meanwhile the lock is free for other callbacks
+        assert transform._write_lock.acquire(timeout=1)
+        transform._write_lock.release()
+    finally:
+        release.set()
+        waiter.join(5)
+        transform._flush()
+        transform._writer.shutdown()
+
+    rows = batched_rows(transform.neo4j_conn)
+    assert len(rows[_MERGE_WEBSITES]) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_background_write_is_raised_by_scan():
+    """Test that a writer error fails the scan, not the crawl that waited on it."""
+    transform = WebsiteToLinks(sketch_id="test", scan_id="test")
+    transform.neo4j_conn = Mock()
+    transform.log_graph_message = Mock()
+    transform.BATCH_SIZE = 1
+    failures = [RuntimeError("neo4j down")]
+
+    def write_once_failing(queries):
+        if failures:
+            raise failures.pop()
+
+    transform.neo4j_conn.execute_batch.side_effect = write_once_failing
+
+    with patch("spectragraph_transforms.website.to_links.Crawler", MockCrawler):
+        with patch("spectragraph_transforms.website.to_links.Logger") as logger:
+            with pytest.raises(RuntimeError, match="neo4j down"):
+                await transform.scan([Website(url="https://example.com")])
+
+    # The crawl itself succeeded and was not reported as failed
+    logger.error.assert_not_called()
+    # The failed batch held the main website, which can be queued again
+    assert ("website", "https://example.com/") not in transform._seen_nodes
+    assert ("website", "https://example.com/page1") in transform._seen_nodes
+    assert transform._write_error is None
+
+
+def test_large_flush_uses_apoc_periodic_iterate():
+    """Test that row lists above APOC_THRESHOLD are written server-side."""
+    transform = WebsiteToLinks(sketch_id="test", scan_id="test")
+    transform.neo4j_conn = Mock()
+    transform.neo4j_conn.query.return_value = [
+        {"batches": 1, "failedBatches": 0, "errorMessages": {}}
+    ]
+    transform.APOC_THRESHOLD = 2
+
+    for i in range(3):
+        transform._queue_website(f"https://example.com/{i}")
+    transform._queue_domain("example.com")
+    transform._flush()
+
+    # Small lists still go through the inline UNWIND transaction
+    transform.neo4j_conn.execute_batch.assert_called_once()
+    (queries,) = transform.neo4j_conn.execute_batch.call_args.args
+    assert [query for query, _ in queries] == [_MERGE_DOMAINS]
+
+    # The website list is above the threshold and goes through APOC
+    query, params = transform.neo4j_conn.query.call_args.args
+    assert query == _APOC_ITERATE
+    assert params["action"] == _MERGE_WEBSITES.replace("UNWIND $rows AS r\n", "", 1)
+    assert "UNWIND" not in params["action"]
+    assert params["parallel"] is True
+    assert params["sketch_id"] == "test"
+    assert len(params["rows"]) == 3
+
+
+def test_apoc_write_raises_on_failed_batches():
+    """Test that batches APOC reports as failed are not dropped silently."""
+    transform = WebsiteToLinks(sketch_id="test", scan_id="test")
+    transform.neo4j_conn = Mock()
+    transform.neo4j_conn.query.return_value = [
+        {
+            "batches": 3,
+            "failedBatches": 1,
+            "errorMessages": {"ForsetiClient can't acquire ExclusiveLock": 1},
+        }
+    ]
+
+    with pytest.raises(RuntimeError, match="1 of 3 batches failed.*ExclusiveLock"):
+        transform._bulk_write_via_apoc(
+            _MERGE_LINKS["LINKS_TO"], [{"source": "a", "target": "b"}], {}, False
+        )
+
 
 @pytest.mark.asyncio
 async def test_website_to_links_error_handling_with_neo4j():
@@ -217,37 +308,28 @@ async def test_website_to_links_error_handling_with_neo4j():
         raise Exception("Test error")
 
     websites = [Website(url="https://example.com")]
+    main_url = str(websites[0].url)
 
-    with patch("src.transforms.websites.to_links.Crawler", mock_crawler_error):
+    with patch("spectragraph_transforms.website.to_links.Crawler", mock_crawler_error):
         results = await transform.scan(websites)
 
-    # Verify main website and domain nodes were still created despite error
-    transform.create_node.assert_any_call(
-        "website",
-        "url",
-        "https://example.com",
-        caption="https://example.com",
-        type="website",
-    )
-    transform.create_node.assert_any_call(
-        "domain", "name", "example.com", caption="example.com", type="domain"
-    )
+    # Main website and domain nodes were still written, in a single batch
+    transform.neo4j_conn.execute_batch.assert_called_once()
+    transform.create_node.assert_not_called()
+    transform.create_relationship.assert_not_called()
+    rows = batched_rows(transform.neo4j_conn)
+    assert {"url": main_url} in rows[_MERGE_WEBSITES]
+    assert {"name": "example.com"} in rows[_MERGE_DOMAINS]
 
     # Verify main website to domain relationship was created
-    transform.create_relationship.assert_any_call(
-        "website",
-        "url",
-        "https://example.com",
-        "domain",
-        "name",
-        "example.com",
-        "BELONGS_TO_DOMAIN",
-    )
+    assert {"source": main_url, "target": "example.com"} in rows[
+        _MERGE_LINKS["BELONGS_TO_DOMAIN"]
+    ]
 
     # Verify result structure
     assert len(results) == 1
     result = results[0]
-    assert result["website"] == "https://example.com"
+    assert result["website"] == main_url
     assert result["main_domain"] == "example.com"
     assert result["internal_urls"] == []
     assert result["external_urls"] == []
@@ -0,0 +1,61 @@
+import pytest
+from unittest.mock import Mock, patch
+from spectragraph_transforms.website.to_webtrackers import (
+    WebsiteToWebtrackersTransform,
+    _MERGE_TRACKERS,
+)
+from spectragraph_types.website import Website
+
+
+class MockTrackingCode:
+    def __init__(self, source, code):
+        self.source = source
+        self.code = code
+
+
+class MockExtractor:
+    def __init__(self, url):
+        self.url = url
+
+    def fetch(self):
+        pass
+
+    def extract_codes(self):
+        pass
+
+    def get_results(self):
+        return [
+            MockTrackingCode("Google Analytics", "UA-12345-1"),
+            MockTrackingCode("Google Tag Manager", "GTM-ABCDE"),
+        ]
+
+
+@pytest.mark.asyncio
+async def test_website_to_webtrackers_batched_neo4j_creation():
+    """Test that trackers are written as a single UNWIND batch."""
+    transform = WebsiteToWebtrackersTransform(sketch_id="test", scan_id="test")
+    transform.neo4j_conn = Mock()
+    transform.log_graph_message = Mock()
+
+    websites = [Website(url="https://example.com"), Website(url="https://other.org")]
+
+    with patch(
+        "spectragraph_transforms.website.to_webtrackers.TrackingCodeExtractor",
+        MockExtractor,
+    ):
+        results = await transform.scan(websites)
+    transform.postprocess(results, websites)
+
+    assert len(results) == 4
+    transform.neo4j_conn.execute_batch.assert_called_once()
+    (queries,) = transform.neo4j_conn.execute_batch.call_args.args
+    assert [query for query, _ in queries] == [_MERGE_TRACKERS]
+
+    params = queries[0][1]
+    assert params["sketch_id"] == "test"
+    assert len(params["rows"]) == 4
+    assert {
+        "website": str(websites[1].url),
+        "tracker_id": "GTM-ABCDE",
+        "name": "Google Tag Manager",
+    } in params["rows"]
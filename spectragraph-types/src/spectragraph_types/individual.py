@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Literal, List
 from .address import Location
 
@@ -6,6 +6,9 @@ from .address import Location
 class Individual(BaseModel):
     """Represents an individual person with comprehensive personal information."""
 
+    # Schemas are built on first use rather than when the package is imported
+    model_config = ConfigDict(defer_build=True)
+
     # Basic Information
     first_name: str = Field(
         ..., description="First name of the individual", title="First Name"
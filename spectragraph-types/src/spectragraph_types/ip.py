@@ -1,10 +1,13 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 
 
 class Ip(BaseModel):
     """Represents an IP address with geolocation and ISP information."""
 
+    # Schemas are built on first use rather than when the package is imported
+    model_config = ConfigDict(defer_build=True)
+
     address: str = Field(..., description="IP address", title="IP Address")
     latitude: Optional[float] = Field(
         None, description="Latitude coordinate of the IP location", title="Latitude"
@@ -1,10 +1,13 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 
 
 class Message(BaseModel):
     """Represents a message with content, metadata, and security analysis."""
 
+    # Schemas are built on first use rather than when the package is imported
+    model_config = ConfigDict(defer_build=True)
+
     message_id: str = Field(
         ..., description="Unique message identifier", title="Message ID"
     )
@@ -1,10 +1,13 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, List
 
 
 class RiskProfile(BaseModel):
     """Represents a comprehensive risk assessment profile for an entity."""
 
+    # Schemas are built on first use rather than when the package is imported
+    model_config = ConfigDict(defer_build=True)
+
     entity_id: str = Field(..., description="Entity identifier", title="Entity ID")
     entity_type: Optional[str] = Field(
         None, description="Type of entity", title="Entity Type"
@@ -1,10 +1,17 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List
+import hashlib
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Optional, List
+
+# Scripts are hashed in chunks so every digest reads the same cached slice
+_HASH_CHUNK = 64 * 1024
 
 
 class Script(BaseModel):
     """Represents a script or code file with analysis and security information."""
 
+    # Schemas are built on first use rather than when the package is imported
+    model_config = ConfigDict(defer_build=True)
+
     script_id: str = Field(
         ..., description="Unique script identifier", title="Script ID"
     )
@@ -63,3 +70,23 @@ class Script(BaseModel):
     minified: Optional[bool] = Field(
         None, description="Whether script is minified", title="Minified"
     )
+
+    @classmethod
+    def from_bytes(cls, script_id: str, content: bytes, **extra: Any) -> "Script":
+        """Build a Script from raw content, filling in its hashes and size."""
+        md5, sha1, sha256 = hashlib.md5(), hashlib.sha1(), hashlib.sha256()
+        view = memoryview(content)
+        for start in range(0, len(view), _HASH_CHUNK):
+            chunk = view[start : start + _HASH_CHUNK]
+            md5.update(chunk)
+            sha1.update(chunk)
+            sha256.update(chunk)
+        return cls(
+            script_id=script_id,
+            content=content.decode("utf-8", errors="replace"),
+            hash_md5=md5.hexdigest(),
+            hash_sha1=sha1.hexdigest(),
+            hash_sha256=sha256.hexdigest(),
+            file_size=len(content),
+            **extra,
+        )